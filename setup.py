@@ -16,5 +16,6 @@ setup(name='validictory',
       license="MIT License",
       platforms=["any"],
       packages=find_packages(),
+      extras_require={'numpy': ['numpy']},
       test_suite="validictory.tests",
      )
@@ -1,13 +1,19 @@
 #!/usr/bin/env python
 
-from validictory.validator import SchemaValidator, ValidationError, SchemaError, validate
+from validictory.validator import SchemaValidator, ValidationError, SchemaError, validate, is_valid
+from validictory.validator import CompiledSchema, compile, schema_cache
+from validictory.validator import validate_many, ValidationResult
 from validictory.extended import ExtendedSchemaValidator
-from validictory.coercer import SchemaCoercer, ExtendedSchemaCoercer
+from validictory.coercer import SchemaCoercer, ExtendedSchemaCoercer, coerce_many
+from validictory.parallel import validate_parallel
+from validictory.asynchronous import validate_async, ValidationCancelled
+from validictory.stream import validate_stream
+from validictory.cache import fingerprint
 from validictory.schema import String, Object, Array, Number, Boolean
 from validictory.schema import Any, Either, Datetime, Integer, StrictObject
 
-__all__ = ['validate', 'coerce', 'SchemaValidator', 'ValidationError',
-    'SchemaError', 'SchemaCoercer', 'ExtendedSchemaValidator', 'ExtendedSchemaCoercer',
+__all__ = ['validate', 'is_valid', 'validate_many', 'coerce_many', 'validate_parallel', 'validate_async', 'ValidationCancelled', 'validate_stream', 'fingerprint', 'ValidationResult', 'coerce', 'compile', 'CompiledSchema', 'SchemaValidator', 'ValidationError',
+    'SchemaError', 'schema_cache', 'SchemaCoercer', 'ExtendedSchemaValidator', 'ExtendedSchemaCoercer',
     'String', 'Object', 'Array', 'Integer', 'Number', 'Boolean', 'Any',
     'Either', 'Datetime', 'StrictObject', 'Either',
     'validate'
@@ -16,21 +22,5 @@ __version__ = '0.9.9-homeloc'
 
 
 if __name__ == '__main__':
-    import sys
-    import json
-    if len(sys.argv) == 2:
-        if sys.argv[1] == "--help":
-            raise SystemExit("%s SCHEMAFILE [INFILE]" % (sys.argv[0],))
-        schemafile = open(sys.argv[1], 'rb')
-        infile = sys.stdin
-    elif len(sys.argv) == 3:
-        schemafile = open(sys.argv[1], 'rb')
-        infile = open(sys.argv[2], 'rb')
-    else:
-        raise SystemExit("%s SCHEMAFILE [INFILE]" % (sys.argv[0],))
-    try:
-        obj = json.load(infile)
-        schema = json.load(schemafile)
-        validate(obj, schema)
-    except ValueError as e:
-        raise SystemExit(e)
+    from validictory.__main__ import main
+    main()
@@ -0,0 +1,111 @@
+'''
+    Validates json documents against a json schema from the command line::
+
+        python -m validictory [--stream] SCHEMAFILE [INFILE]
+        python -m validictory --ndjson [--workers N] SCHEMAFILE [INFILE]
+
+    The document is read from INFILE, or from the standard input. With
+    ``--stream`` an array document is validated an item at a time, see
+    :func:`validictory.stream.validate_stream`.
+
+    With ``--ndjson`` each line of the input is a document of its own, see
+    :func:`validictory.ndjson.validate_lines`. An INFILE is memory-mapped
+    and its ranges of lines validated by the workers straight from the
+    file, see :func:`validictory.ndjson.validate_file`. A json line is
+    written for each invalid line, with its number, its offset in INFILE
+    and its errors::
+
+        {"line": 3, "offset": 10, "errors": [{"code": "incorrect-type",
+                                              "path": "n",
+                                              "message": "integer"}]}
+
+    the messages of format validators coming with the ``format`` code and
+    no path, followed by a summary on the standard error, with the number
+    of lines per second. The exit status is 1 if any line is invalid.
+'''
+
+import sys
+import json
+import time
+import argparse
+
+from validictory.validator import validate
+from validictory.stream import validate_stream
+from validictory.ndjson import validate_lines, validate_file
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog='python -m validictory')
+    parser.add_argument('schemafile', metavar='SCHEMAFILE')
+    parser.add_argument('infile', metavar='INFILE', nargs='?')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--stream', action='store_true',
+                      help='validate an array an item at a time')
+    mode.add_argument('--ndjson', action='store_true',
+                      help='validate each line as a document of its own')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='the number of processes validating the lines'
+                        ' with --ndjson, 0 for one per CPU')
+    return parser
+
+
+def main(argv=None, stdout=None, stderr=None):
+    argv = sys.argv if argv is None else argv
+    args = _parser().parse_args(argv[1:])
+
+    schemafile = open(args.schemafile, 'rb')
+    infile = open(args.infile, 'rb') if args.infile else sys.stdin
+    try:
+        schema = json.load(schemafile)
+        if args.ndjson:
+            if args.infile:
+                results = validate_file(args.infile, schema,
+                                        args.workers or None)
+            else:
+                results = ((number, None, result) for number, result in
+                           validate_lines(infile, schema,
+                                          args.workers or None))
+            return _report(results, stdout or sys.stdout,
+                           stderr or sys.stderr)
+        if args.stream:
+            validate_stream(infile, schema)
+        else:
+            validate(json.load(infile), schema)
+    except ValueError as e:
+        raise SystemExit(e)
+
+
+def _error(error):
+    # format validators add plain messages, without a code or a path
+    if not isinstance(error, tuple):
+        return ('format', None, error, None)
+    return error
+
+
+def _report(results, stdout, stderr):
+    start = time.time()
+    lines = invalid = 0
+    for number, offset, result in results:
+        lines += 1
+        if not result.valid:
+            invalid += 1
+            report = dict(line=number, errors=[
+                dict(code=code, path=path, message=message)
+                for code, path, message, _ in map(_error, result.errors)])
+            if offset is not None:
+                report['offset'] = offset
+            stdout.write(json.dumps(report, sort_keys=True, default=repr) +
+                         '\n')
+    seconds = time.time() - start
+
+    stderr.write(json.dumps(dict(
+        lines=lines, valid=lines - invalid, invalid=invalid,
+        seconds=round(seconds, 3),
+        lines_per_second=int(lines / seconds) if seconds else None),
+        sort_keys=True) + '\n')
+    if invalid:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
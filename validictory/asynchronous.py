@@ -0,0 +1,255 @@
+'''
+    asynchronous.py, validation of large documents without blocking an event
+    loop.
+
+    The validation runs in a thread of its own, and the caller drives it a
+    step at a time by iterating over a :class:`AsyncValidation`: each step
+    validates at most ``yield_every`` schema nodes, after which the
+    validation waits for the next step and the caller is free to hand
+    control back to its event loop. Documents small enough to be validated
+    in a single step are validated right away instead, and a validation
+    given to an executor runs on its own, without waiting for the caller.
+'''
+
+import sys
+import copy
+import threading
+
+from validator import SchemaValidator, _cached, _reraise
+
+
+class ValidationCancelled(Exception):
+    '''
+    Raised when iterating over a cancelled :class:`AsyncValidation`.
+    '''
+
+
+class _Steps(object):
+    '''
+    The state shared by an :class:`AsyncValidation` and the thread running
+    it. The thread holds no reference to the :class:`AsyncValidation`
+    itself, which can so be collected, and stop the thread, once the caller
+    lets go of it.
+    '''
+
+    def __init__(self, yield_every, pausing):
+        self.yield_every = yield_every
+        # whether the thread waits for each step, rather than running on its
+        # own
+        self.pausing = pausing
+        self.condition = threading.Condition()
+        # whether the thread may go on, until its next checkpoint
+        self.running = False
+        self.done = False
+        self.cancelled = False
+        self.result = None
+        self.error = None
+        self.count = 0
+
+    def step(self):
+        '''
+        Lets the validation go on for a step, and waits for it.
+        '''
+        with self.condition:
+            self.running = True
+            self.condition.notify_all()
+            while self.running and not self.done:
+                self.condition.wait()
+
+    def cancel(self):
+        with self.condition:
+            self.cancelled = True
+            self.condition.notify_all()
+
+    def checkpoint(self, nodes=1):
+        if not self.pausing:
+            if self.cancelled:
+                raise ValidationCancelled()
+            return
+
+        self.count += nodes
+        if self.count < self.yield_every:
+            return
+        self.count = 0
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+            self._wait()
+
+    def run(self, compiled, validator, data):
+        try:
+            if self.pausing:
+                # wait for the first step
+                with self.condition:
+                    self._wait()
+            elif self.cancelled:
+                raise ValidationCancelled()
+            self.result = compiled._apply(validator, data)
+        except Exception:
+            self.error = sys.exc_info()
+        finally:
+            with self.condition:
+                self.done = True
+                self.condition.notify_all()
+
+    def _wait(self):
+        while not self.running and not self.cancelled:
+            self.condition.wait()
+        if self.cancelled:
+            raise ValidationCancelled()
+
+
+class AsyncValidation(object):
+    '''
+    The validation of a document against a compiled schema, going on in
+    the background, see :func:`validate_async`.
+
+    Iterating over it runs the validation a step at a time, the iteration
+    ending with the validation, raising its :class:`ValidationError` if the
+    document isn't valid. The validated data is then in :attr:`result`.
+
+    A validation left before its end should be closed, with :meth:`close`
+    or by using it as a context manager, to release the thread running it;
+    it is closed anyway once it is garbage collected.
+    '''
+
+    #: the number of values up to which a document is validated right away
+    #: when the validation isn't split in steps (``yield_every=None``)
+    inline_size = 1000
+
+    def __init__(self, compiled, data, yield_every=1000, executor=None):
+        self.yield_every = yield_every
+        small = _small(data, yield_every or self.inline_size)
+        # a worker of an executor isn't held between steps, the validation
+        # runs on its own there
+        self._steps = steps = _Steps(yield_every, bool(
+            yield_every and executor is None and not small))
+
+        validator = copy.copy(compiled.validator)
+        if small:
+            # validated in a single step anyway, there is nothing to gain
+            # from another thread
+            steps.run(compiled, validator, data)
+            return
+        validator._checkpoint = steps.checkpoint
+
+        target = lambda: steps.run(compiled, validator, data)
+        if executor is not None:
+            executor.submit(target)
+        else:
+            thread = threading.Thread(target=target)
+            thread.daemon = True
+            thread.start()
+
+    @property
+    def result(self):
+        '''
+        The validated data, once the validation is over.
+        '''
+        return self._steps.result
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self._steps.done:
+            self._finish()
+        if self._steps.pausing:
+            self._steps.step()
+        if self._steps.done:
+            self._finish()
+
+    __next__ = next
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def done(self):
+        '''
+        Tells whether the validation is over.
+        '''
+        return self._steps.done
+
+    def cancel(self):
+        '''
+        Stops the validation at its next step, iterating over it then raises
+        :class:`ValidationCancelled`. To time a validation out, cancel it
+        once its time is up.
+        '''
+        self._steps.cancel()
+
+    def close(self):
+        '''
+        Cancels the validation if it isn't over, letting the thread running
+        it go.
+        '''
+        if not self._steps.done:
+            self._steps.cancel()
+
+    def _finish(self):
+        steps = self._steps
+        if steps.cancelled:
+            raise ValidationCancelled()
+        if steps.error is not None:
+            error, steps.error = steps.error, None
+            _reraise(error)
+        raise StopIteration
+
+
+def _small(data, limit):
+    '''
+    Tells whether a document holds at most ``limit`` values, looking at no
+    more of them than that.
+    '''
+    count = 0
+    pending = [data]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, (dict, list, tuple)):
+            count += len(value)
+            if count > limit:
+                return False
+            pending.extend(value.values() if isinstance(value, dict)
+                           else value)
+    return True
+
+
+def validate_async(data, schema, yield_every=1000, executor=None,
+                   validator_cls=SchemaValidator, format_validators=None,
+                   required_by_default=False, blank_by_default=False,
+                   ignore_required=False, fail_fast=False, max_errors=None):
+    '''
+    Starts validating a parsed json document against the provided schema in
+    the background, and returns the :class:`AsyncValidation` to iterate
+    over, between the steps of which an event loop can run. Takes the same
+    options as :func:`validate`.
+
+    Each step validates at most ``yield_every`` schema nodes. With
+    ``yield_every=None`` the validation isn't split in steps but runs on its
+    own, and each iteration only tells it isn't over yet. The validation
+    runs in a new thread, or through ``executor.submit`` when an
+    ``executor`` (such as a thread pool) is given, where it always runs on
+    its own so as not to keep a worker waiting between steps. A document
+    of no more than ``yield_every`` values (or
+    :attr:`AsyncValidation.inline_size` without steps) is validated right
+    away, in the calling thread, the iteration then ending at once.
+
+    With trollius or tornado coroutines::
+
+        validation = validictory.validate_async(data, schema)
+        for _ in validation:
+            yield From(asyncio.sleep(0))
+        data = validation.result
+
+    If there is an issue in the schema a :class:`SchemaError` will be raised.
+    '''
+    compiled = _cached(schema, validator_cls, format_validators,
+                       required_by_default, blank_by_default, ignore_required,
+                       fail_fast, max_errors)
+    return AsyncValidation(compiled, data, yield_every, executor)
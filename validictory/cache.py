@@ -0,0 +1,246 @@
+'''
+    cache.py, a bounded cache of compiled schemas (or of any other values,
+    such as the strings found valid for a format), and the fingerprints
+    keying compiled schemas by their contents.
+'''
+
+import sys
+import json
+import hashlib
+import weakref
+import threading
+
+if sys.version_info[0] == 3:
+    _str_type = str
+    _str_types = (str,)
+    _int_types = (int,)
+else:
+    _str_type = basestring
+    _str_types = (str, unicode)
+    _int_types = (int, long)
+
+
+class SchemaCache(object):
+    '''
+    A least recently used cache of compiled schemas, bounded both by its
+    number of entries and by the (estimated) memory they use.
+
+    :param maxsize: maximum number of entries, 0 disables the cache
+    :param maxbytes: optional maximum of the summed entry sizes, in bytes
+    '''
+
+    def __init__(self, maxsize=256, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        '''
+        Removes all entries and resets the statistics.
+        '''
+        with self._lock:
+            self._entries = {}
+            # circular doubly linked list of [prev, next, key, value, size],
+            # most recently used entries right before the root.
+            self._root = root = []
+            root[:] = [root, root, None, None, 0]
+            self.hits = self.misses = self.evictions = 0
+            self.currbytes = 0
+
+    def resize(self, maxsize=None, maxbytes=None):
+        '''
+        Changes the bounds of the cache, evicting entries as needed.
+        '''
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            self.maxbytes = maxbytes
+            self._evict()
+
+    def get(self, key):
+        '''
+        Returns the value cached for ``key``, or None.
+        '''
+        with self._lock:
+            link = self._entries.get(key)
+            if link is None:
+                self.misses += 1
+                return None
+
+            # move the entry to the most recently used end
+            prev, next = link[0], link[1]
+            prev[1], next[0] = next, prev
+            root = self._root
+            last = root[0]
+            last[1] = root[0] = link
+            link[0], link[1] = last, root
+
+            self.hits += 1
+            return link[3]
+
+    def put(self, key, value, size=0):
+        '''
+        Caches ``value`` under ``key``, ``size`` being its estimated size in
+        bytes.
+        '''
+        with self._lock:
+            if key in self._entries:
+                self._remove(self._entries[key])
+            if self.maxsize <= 0:
+                return
+
+            root = self._root
+            last = root[0]
+            link = [last, root, key, value, size]
+            last[1] = root[0] = self._entries[key] = link
+            self.currbytes += size
+            self._evict()
+
+    def discard(self, key):
+        '''
+        Removes the entry of ``key``, if there is one.
+        '''
+        with self._lock:
+            link = self._entries.get(key)
+            if link is not None:
+                self._remove(link)
+
+    def stats(self):
+        '''
+        Returns the statistics of the cache as a dict with the ``hits``,
+        ``misses``, ``evictions``, ``entries`` and ``bytes`` keys.
+        '''
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.currbytes,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, link):
+        prev, next, key, value, size = link
+        prev[1], next[0] = next, prev
+        del self._entries[key]
+        self.currbytes -= size
+
+    def _evict(self):
+        root = self._root
+        while self._entries and (
+                len(self._entries) > self.maxsize or
+                (self.maxbytes is not None and
+                 self.currbytes > self.maxbytes)):
+            self._remove(root[1])
+            self.evictions += 1
+
+
+def fingerprint(schema):
+    '''
+    Returns a digest of the contents of a schema, the same for equal
+    schemas in any process: the order of the keys, tuples (as built by
+    :func:`Either`) or lists, and the classes of the :mod:`schema`
+    elements don't matter, while ``1``, ``1.0``, ``True`` and ``'1'`` are
+    told apart, as keys as well as values. Values that aren't json are
+    taken by their ``repr``.
+
+    The digest is memoized for each schema object, so a schema should not
+    be modified after it has been fingerprinted.
+    '''
+    entry = _fingerprints.get(id(schema))
+    if entry is not None and entry[0]() is schema:
+        return entry[1]
+
+    digest = _digest(schema)
+    if type(schema) is dict:
+        # plain dicts can't be held weakly, the entry keeps them alive so
+        # that their id isn't reused
+        ref = lambda: schema
+    else:
+        # held weakly when it can be, such as the schema elements, a dead
+        # schema then no longer matching the id
+        try:
+            ref = weakref.ref(schema)
+        except TypeError:
+            ref = lambda: schema
+    _fingerprints.put(id(schema), (ref, digest))
+    return digest
+
+
+def _forget(schema):
+    '''
+    Drops the memoized fingerprint of a schema, once it has been modified.
+    '''
+    _fingerprints.discard(id(schema))
+
+
+def _digest(schema):
+    '''
+    Returns the digest of the current contents of a schema, see
+    :func:`fingerprint`.
+    '''
+    return hashlib.sha1(_canonical(schema).encode('utf-8')).hexdigest()
+
+
+def _canonical(value):
+    # json with the keys of the objects sorted, the keys themselves written
+    # as values; what isn't json is written as the json string of its repr,
+    # after a '!'. The usual types are looked up by type, as this runs for
+    # every schema not fingerprinted yet.
+    return _ENCODERS.get(type(value), _other)(value)
+
+
+def _object(value):
+    encoder = _ENCODERS.get
+    return '{%s}' % ','.join(sorted([
+        encoder(type(key), _other)(key) + ':' +
+        encoder(type(item), _other)(item)
+        for key, item in value.items()]))
+
+
+def _array(value):
+    encoder = _ENCODERS.get
+    return '[%s]' % ','.join([encoder(type(item), _other)(item)
+                              for item in value])
+
+
+def _string(value):
+    try:
+        return _encode_string(value)
+    except UnicodeDecodeError:
+        return '!' + _encode_string(repr(value))
+
+
+def _other(value):
+    # subclasses of the usual types, and what isn't json
+    if isinstance(value, dict):
+        return _object(value)
+    if isinstance(value, (list, tuple)):
+        return _array(value)
+    if isinstance(value, _str_type):
+        return _string(value)
+    elif value is None or value is True or value is False:
+        return _CONSTANTS[value]
+    elif isinstance(value, _int_types):
+        return '%d' % value
+    elif isinstance(value, float):
+        return repr(value)
+    return '!' + _encode_string(repr(value))
+
+
+_encode_string = json.encoder.encode_basestring_ascii
+_CONSTANTS = {None: 'null', True: 'true', False: 'false'}
+
+_ENCODERS = {dict: _object, list: _array, tuple: _array, float: repr,
+             bool: _CONSTANTS.__getitem__, type(None): _CONSTANTS.__getitem__}
+for _type in _int_types:
+    _ENCODERS[_type] = '%d'.__mod__
+for _type in _str_types:
+    _ENCODERS[_type] = _string
+del _type
+
+_fingerprints = SchemaCache(maxsize=1024)
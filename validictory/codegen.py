@@ -0,0 +1,724 @@
+'''
+    codegen.py, generates python source specialized for a schema.
+
+    Instead of walking the compiled schema nodes and calling the
+    ``validate_<property>`` methods for every value, the checks of the
+    schema are written out as straight python code (``isinstance``, ``len``
+    and comparisons, with property lookups inlined), which is then executed
+    into a single validation function.
+
+    Only the ``validate_*`` methods of :class:`SchemaValidator` are turned
+    into code. Methods overridden or added by a subclass, and the few
+    unusual schema constructs not handled here, are still called as they
+    would be by :class:`CompiledSchema`, so the errors reported are the same
+    either way.
+'''
+
+import sys
+from collections import Mapping, Container
+
+from enumeration import Enumeration
+from validator import (SchemaValidator, CompiledSchema, _node, _Stop,
+                       _INVALID, _method, _report_items, _duplicates,
+                       _str_type, _int_types)
+
+
+def _base(name):
+    return _method(SchemaValidator, name)
+
+
+# The generated code knows the path of the fields it validates, it tells the
+# validator where it is at when calling back into the validate_* methods and
+# the schema nodes, for the errors they may report.
+
+def _call(validator, method, x, fieldname, schema, value, parts):
+    validator._path_prefix = (('_data',) + parts, x)
+    method(validator, x, fieldname, schema, value)
+
+
+def _visit(validator, schema, x, fieldname, parts):
+    validator._path_prefix = (('_data',) + parts, x)
+    _node(validator, schema).validate(validator, fieldname, x)
+
+
+def _format(validator, format_validator, fieldname, value, format_option,
+            parts):
+    validator._path_prefix = (('_data',) + parts, None)
+    validator._format(format_validator, fieldname, value, format_option)
+    validator._check_errors()
+
+
+def _batch(validator, batch, values, parts):
+    failures = batch.failures(values)
+    if failures is None:
+        return False
+    validator._path_prefix = (('_data',) + parts, None)
+    _report_items(validator, failures)
+    return True
+
+
+def _name(fieldname):
+    return fieldname if not isinstance(fieldname, int) else '[%d]' % fieldname
+
+
+def _path(parts):
+    return u'.'.join(parts) or None
+
+
+def _unique(validator, values, parts):
+    for first, index, value in _duplicates(values):
+        validator.error_list.append(_INVALID if validator._quiet else
+                                    ('not-unique', _path(parts), value,
+                                     (first, index)))
+        validator._check_errors()
+
+
+_NAMESPACE = {
+    '_str': _str_type,
+    '_int': _int_types,
+    '_num': _int_types + (float,),
+    'Mapping': Mapping,
+    '_call': _call,
+    '_visit': _visit,
+    '_format': _format,
+    '_batch': _batch,
+    '_name': _name,
+    '_path': _path,
+    '_unique': _unique,
+    '_Stop': _Stop,
+    '_INVALID': _INVALID,
+}
+
+# source for the types SchemaValidator knows about, see validate_type_*
+_TYPE_TESTS = {
+    'string': 'isinstance(%(v)s, _str)',
+    'integer': 'type(%(v)s) in _int',
+    'number': 'type(%(v)s) in _num',
+    'boolean': 'type(%(v)s) == bool',
+    'object': 'isinstance(%(v)s, Mapping)',
+    'array': 'isinstance(%(v)s, (list, tuple))',
+    'null': '%(v)s is None',
+    'any': 'True',
+}
+
+# the validator methods the generator can write out as code
+_NATIVE = dict((_base('validate_' + name), '_gen_' + name) for name in (
+    'blank', 'properties', 'items', 'minimum', 'maximum', 'minLength',
+    'maxLength', 'format', 'pattern', 'uniqueItems', 'enum', 'divisibleBy',
+    'dependencies', 'additionalProperties', 'patternProperties',
+    'additionalItems', 'extends'))
+
+
+class _Context(object):
+    '''
+    Where a schema applies in the generated code: ``x`` and ``key`` are the
+    source of the container and the field name, ``parts`` the path of the
+    field as ``(is_constant, value_or_source)`` pairs.
+    '''
+
+    def __init__(self, x, key, parts, container, exists=None, value=None):
+        self.x = x
+        self.key = key
+        self.parts = parts
+        # 'dict', 'list' or 'any'
+        self.container = container
+        # source telling whether the field exists, None when it always does
+        self.exists = exists
+        # source of the value when it is already known (a loop variable)
+        self.value = value
+        self.v = None
+
+    def copy(self):
+        return _Context(self.x, self.key, self.parts, self.container,
+                        self.exists)
+
+    def read(self):
+        if self.exists:
+            return '%s.get(%s)' % (self.x, self.key)
+        return '%s[%s]' % (self.x, self.key)
+
+
+class _Generator(object):
+
+    # beyond these, sub-schemas are left to the compiled nodes: python
+    # limits how deeply blocks can be nested.
+    max_indent = 60
+    max_loops = 15
+
+    def __init__(self, compiled):
+        self.compiled = compiled
+        self.cls = type(compiled.validator)
+        self.namespace = dict(_NAMESPACE)
+        self.constants = {}
+        self.lines = []
+        self.indent = 0
+        self.loops = 0
+        self.count = 0
+        self.inlined = []
+
+    def generate(self):
+        self.line('def validate(validator, data):')
+        self.indent += 1
+        self.line("x = {'_data': data}")
+
+        schema = self.compiled.schema
+        if any(_method(self.cls, name) is not _base(name)
+               for name in ('get', '_error', '_validate',
+                            'current_field_name')):
+            # the bookkeeping itself was customized, don't second-guess it
+            self.line('validator._validate(data, %s)' % self.const(schema))
+        elif schema is not None:
+            self.node(schema, _Context('x', "'_data'", [], 'dict'))
+
+        self.line("return x.get('_data')")
+        return '\n'.join(self.lines) + '\n'
+
+    # source helpers
+
+    def line(self, text):
+        self.lines.append('    ' * self.indent + text)
+
+    def var(self, prefix):
+        self.count += 1
+        return '%s%d' % (prefix, self.count)
+
+    def const(self, value):
+        name = self.constants.get(id(value))
+        if name is None:
+            name = self.constants[id(value)] = '_k%d' % len(self.constants)
+            self.namespace[name] = value
+        return name
+
+    def literal(self, value):
+        if value is None or isinstance(value, (_str_type, bool) + _int_types):
+            return repr(value)
+        if isinstance(value, float) and float(repr(value)) == value:
+            return repr(value)
+        return self.const(value)
+
+    def regex(self, pattern):
+        try:
+            return self.compiled.patterns.get(pattern)
+        except TypeError:
+            return None
+
+    def matcher(self, patternproperties):
+        matcher = self.compiled.matchers.get(id(patternproperties))
+        if (matcher is None or
+                matcher.patternproperties is not patternproperties):
+            return None
+        return matcher
+
+    def parts(self, parts):
+        if all(constant for constant, value in parts):
+            return self.const(tuple(value for constant, value in parts))
+        return '(%s,)' % ', '.join(self.literal(value) if constant else value
+                                   for constant, value in parts)
+
+    def path(self, parts):
+        if all(constant for constant, value in parts):
+            try:
+                return self.literal(u'.'.join(value for constant, value
+                                              in parts) or None)
+            except TypeError:
+                pass
+        return '_path(%s)' % self.parts(parts)
+
+    def error(self, ctx, code, message='None', suppl='None'):
+        self.line('validator.error_list.append(_INVALID if validator._quiet '
+                  'else (%r, %s, %s, %s))' %
+                  (code, self.path(ctx.parts), message, suppl))
+        self.line('validator._check_errors()')
+
+    def begin(self, text):
+        self.line(text)
+        self.indent += 1
+        return len(self.lines)
+
+    def end(self, start):
+        if len(self.lines) == start:
+            self.line('pass')
+        self.indent -= 1
+
+    def call(self, ctx, node, method, value):
+        self.line('_call(validator, %s, %s, %s, %s, %s, %s)' % (
+            self.const(method), ctx.x, ctx.key, self.const(node.params),
+            self.literal(value), self.parts(ctx.parts)))
+        if ctx.v:
+            # the method may have replaced the value (coercion)
+            self.line('%s = %s' % (ctx.v, ctx.read()))
+
+    # schemas
+
+    def node(self, schema, ctx):
+        if schema is None:
+            return
+
+        node = self.compiled.nodes.get(id(schema))
+        if (node is None or node.schema is not schema or
+                id(schema) in self.inlined or
+                self.indent > self.max_indent or
+                self.loops > self.max_loops):
+            self.line('_visit(validator, %s, %s, %s, %s)' % (
+                self.const(schema), ctx.x, ctx.key, self.parts(ctx.parts)))
+            return
+
+        self.inlined.append(id(schema))
+        indent = self.indent
+        self._node(node, ctx)
+        self.indent = indent
+        self.inlined.pop()
+
+    def _node(self, node, ctx):
+        if node.has_default and ctx.container == 'dict' and ctx.exists:
+            start = self.begin('if %s not in %s:' % (ctx.key, ctx.x))
+            self.line('%s[%s] = %s' % (ctx.x, ctx.key,
+                                       self.literal(node.default)))
+            self.end(start)
+
+        if node.required is not None:
+            method, required = node.required
+            if method is not _base('validate_required'):
+                self.call(ctx, node, method, required)
+            elif ctx.exists or ctx.container == 'list':
+                start = self.begin('if %s not in %s:' % (ctx.key, ctx.x))
+                self.error(ctx, 'missing-required')
+                self.end(start)
+
+        if ctx.value:
+            ctx.v = ctx.value
+        else:
+            ctx.v = self.var('v')
+            self.line('%s = %s' % (ctx.v, ctx.read()))
+
+        if node.type is not None:
+            method, fieldtype = node.type
+            test = None
+            if method is _base('validate_type'):
+                test = self.type_test(fieldtype, ctx.v)
+
+            if test is not None:
+                if test != 'True':
+                    condition = 'not %s' % test
+                    if ctx.exists:
+                        condition = '%s and %s' % (ctx.exists, condition)
+                    start = self.begin('if %s:' % condition)
+                    self.error(ctx, 'incorrect-type', self.literal(fieldtype),
+                               ctx.v)
+                    self.end(start)
+                    self.begin('else:')
+            else:
+                # do not keep validating an object if its type was not correct
+                count = self.var('n')
+                self.line('%s = len(validator.error_list)' % count)
+                if method is not _base('validate_type') or \
+                        not self.type_check(fieldtype, ctx):
+                    self.call(ctx, node, method, fieldtype)
+                self.begin('if len(validator.error_list) == %s:' % count)
+
+        start = len(self.lines)
+        for method, value in node.checks:
+            generate = _NATIVE.get(method)
+            if not generate or not getattr(self, generate)(node, ctx, value):
+                self.call(ctx, node, method, value)
+        if len(self.lines) == start and node.type is not None:
+            self.line('pass')
+
+    def type_test(self, fieldtype, v):
+        '''
+        Source of an expression telling whether ``v`` is of ``fieldtype``,
+        or None if that needs more than an expression.
+        '''
+        if not fieldtype:
+            return 'True'
+
+        if isinstance(fieldtype, (list, tuple)):
+            tests = [self.type_test(eachtype, v) for eachtype in fieldtype]
+            if None in tests:
+                return None
+            if 'True' in tests:
+                return 'True'
+            return '(%s)' % ' or '.join(tests)
+
+        if isinstance(fieldtype, _str_type):
+            type_checker = _method(self.cls, 'validate_type_%s' % fieldtype)
+            if type_checker is None:
+                return None
+            if (fieldtype in _TYPE_TESTS and
+                    type_checker is _base('validate_type_%s' % fieldtype)):
+                return _TYPE_TESTS[fieldtype] % {'v': v}
+            return '%s(validator, %s)' % (self.const(type_checker), v)
+
+        return None
+
+    def type_check(self, fieldtype, ctx):
+        '''
+        Writes out :meth:`SchemaValidator.validate_type`, returns False if
+        that is not possible.
+        '''
+        v = ctx.v
+        test = self.type_test(fieldtype, v)
+
+        if test is not None:
+            if test != 'True':
+                condition = 'not %s' % test
+                if ctx.exists:
+                    condition = '%s and %s' % (ctx.exists, condition)
+                start = self.begin('if %s:' % condition)
+                self.error(ctx, 'incorrect-type', self.literal(fieldtype), v)
+                self.end(start)
+            return True
+
+        if isinstance(fieldtype, (list, tuple)):
+            for eachtype in fieldtype:
+                if (not isinstance(eachtype, dict) and
+                        self.type_test(eachtype, v) is None):
+                    return False
+
+        elif not isinstance(fieldtype, dict):
+            return False
+
+        if ctx.exists:
+            start = self.begin('if %s:' % ctx.exists)
+
+        if isinstance(fieldtype, dict):
+            self.node(fieldtype, ctx.copy())
+        else:
+            valid = self.var('t')
+            self.line('%s = False' % valid)
+            for eachtype in fieldtype:
+                test = self.type_test(eachtype, v)
+                if test is not None:
+                    start2 = self.begin('if not %s and %s:' % (valid, test))
+                else:
+                    start2 = self.begin('if not %s:' % valid)
+                    state = self.var('s')
+                    self.line('%s = validator._begin_attempt()' % state)
+                    start3 = self.begin('try:')
+                    self.node(eachtype, ctx.copy())
+                    self.end(start3)
+                    self.begin('except _Stop:')
+                    self.line('pass')
+                    self.indent -= 1
+                    self.begin('if not validator._end_attempt(%s):' % state)
+                    self.line('%s = True' % valid)
+                    self.indent -= 1
+                    self.line('%s = %s' % (v, ctx.read()))
+                    self.indent -= 1
+                    continue
+                self.line('%s = True' % valid)
+                self.end(start2)
+            start2 = self.begin('if not %s:' % valid)
+            self.error(ctx, 'incorrect-type', self.const(fieldtype), v)
+            self.end(start2)
+
+        if ctx.exists:
+            self.end(start)
+        return True
+
+    # validate_* methods of SchemaValidator, each returns False when the
+    # method has to be called instead.
+
+    def _gen_blank(self, node, ctx, blank):
+        start = self.begin('if isinstance(%s, _str) and not %s:' %
+                           (ctx.v, ctx.v))
+        self.error(ctx, 'blank')
+        self.end(start)
+        return True
+
+    def _gen_properties(self, node, ctx, properties):
+        if not isinstance(properties, dict):
+            return False
+
+        start = self.begin('if isinstance(%s, dict):' % ctx.v)
+        for eachProp in properties:
+            key = self.literal(eachProp)
+            self.node(properties.get(eachProp), _Context(
+                ctx.v, key, ctx.parts + [(True, _name(eachProp))], 'dict',
+                exists='%s in %s' % (key, ctx.v)))
+        self.end(start)
+        return True
+
+    def _gen_items(self, node, ctx, items):
+        if not isinstance(items, dict):
+            return False
+
+        start = self.begin('if isinstance(%s, (list, tuple)):' % ctx.v)
+        node = self.compiled.nodes.get(id(items))
+        batch = node.batch(self.compiled.validator) if (
+            node is not None and node.schema is items) else None
+        if batch is not None:
+            # the whole array is checked at once when it can be
+            self.begin('if not _batch(validator, %s, %s, %s):' % (
+                self.const(batch), ctx.v, self.parts(ctx.parts)))
+
+        index, item = self.var('i'), self.var('v')
+        loop = self.begin('for %s, %s in enumerate(%s):' % (index, item,
+                                                            ctx.v))
+        self.loops += 1
+        self.node(items, _Context(
+            ctx.v, index, ctx.parts + [(False, "'[%%d]' %% %s" % index)],
+            'list', value=item))
+        self.loops -= 1
+        self.end(loop)
+        if batch is not None:
+            self.indent -= 1
+        self.end(start)
+        return True
+
+    def _gen_minimum(self, node, ctx, minimum):
+        return self._gen_bound(ctx, minimum,
+                               node.params.get('exclusiveMinimum', False),
+                               '<', 'less-than-minimum')
+
+    def _gen_maximum(self, node, ctx, maximum):
+        return self._gen_bound(ctx, maximum,
+                               node.params.get('exclusiveMaximum', False),
+                               '>', 'more-than-maximum')
+
+    def _gen_bound(self, ctx, bound, exclusive, operator, code):
+        v, bound = ctx.v, self.literal(bound)
+        if exclusive:
+            condition = '%s is not None and %s %s= %s' % (v, v, operator,
+                                                          bound)
+        else:
+            condition = 'type(%s) in (int, float) and %s %s %s' % (
+                v, v, operator, bound)
+        start = self.begin('if %s:' % condition)
+        self.error(ctx, code, bound, v)
+        self.end(start)
+        return True
+
+    def _gen_maxLength(self, node, ctx, length):
+        return self._gen_length(ctx, length, '>', 'too-long')
+
+    def _gen_minLength(self, node, ctx, length):
+        return self._gen_length(ctx, length, '<', 'too-short')
+
+    def _gen_length(self, ctx, length, operator, code):
+        v, length = ctx.v, self.literal(length)
+        start = self.begin(
+            'if isinstance(%s, (_str, list, tuple)) and len(%s) %s %s:' %
+            (v, v, operator, length))
+        self.error(ctx, code, length, 'len(%s)' % v)
+        self.end(start)
+        return True
+
+    def _gen_format(self, node, ctx, format_option):
+        format_validator = self.var('f')
+        option = self.literal(format_option)
+        self.line('%s = validator._format_validators.get(%s)' %
+                  (format_validator, option))
+        start = self.begin('if %s and %s:' % (format_validator, ctx.v))
+        self.line('_format(validator, %s, %s, %s, %s, %s)' % (
+            format_validator, ctx.key, ctx.v, option, self.parts(ctx.parts)))
+        self.end(start)
+        return True
+
+    def _gen_pattern(self, node, ctx, pattern):
+        regex = self.regex(pattern)
+        if regex is None:
+            return False
+
+        start = self.begin('if isinstance(%s, _str) and not %s.match(%s):' %
+                           (ctx.v, self.const(regex), ctx.v))
+        self.error(ctx, 'pattern-mismatch', self.literal(pattern), ctx.key)
+        self.end(start)
+        return True
+
+    def _gen_uniqueItems(self, node, ctx, uniqueItems):
+        if isinstance(uniqueItems, bool) and not uniqueItems:
+            return True
+
+        start = self.begin('if isinstance(%s, (list, tuple)):' % ctx.v)
+        self.line('_unique(validator, %s, %s)' % (ctx.v,
+                                                  self.parts(ctx.parts)))
+        self.end(start)
+        return True
+
+    def _gen_enum(self, node, ctx, options):
+        if not isinstance(options, Container):
+            return False
+
+        enumeration = self.const(Enumeration(options))
+        options = self.const(options)
+        start = self.begin('if %s is not None and %s not in %s:' %
+                           (ctx.v, ctx.v, enumeration))
+        self.error(ctx, 'not-in-enumeration', options, ctx.v)
+        self.end(start)
+        return True
+
+    def _gen_divisibleBy(self, node, ctx, divisibleBy):
+        if (_method(self.cls, 'validate_type_number') is not
+                _base('validate_type_number') or divisibleBy == 0):
+            return False
+
+        v, divisibleBy = ctx.v, self.literal(divisibleBy)
+        start = self.begin('if type(%s) in _num and %s %% %s != 0:' %
+                           (v, v, divisibleBy))
+        self.error(ctx, 'not-divisible-by', divisibleBy, v)
+        self.end(start)
+        return True
+
+    def _gen_dependencies(self, node, ctx, dependencies):
+        if isinstance(dependencies, _str_type):
+            dependencies = [dependencies]
+
+        if isinstance(dependencies, (list, tuple)):
+            checks = [('%s not in %s' % (self.literal(dependency), ctx.x),
+                       self.literal(dependency), 'None')
+                      for dependency in dependencies]
+        elif isinstance(dependencies, dict):
+            checks = [('%s in %s and %s not in %s' % (
+                self.literal(k), ctx.x, self.literal(v), ctx.x),
+                self.literal(k), self.literal(v))
+                for k, v in dependencies.items()]
+        else:
+            return False
+
+        # only the first missing dependency is reported
+        start = self.begin('if %s is not None:' % ctx.v)
+        keyword = 'if'
+        for condition, message, suppl in checks:
+            start2 = self.begin('%s %s:' % (keyword, condition))
+            self.error(ctx, 'dependency', message, suppl)
+            self.end(start2)
+            keyword = 'elif'
+        self.end(start)
+        return True
+
+    def _gen_additionalProperties(self, node, ctx, additionalProperties):
+        if (isinstance(additionalProperties, bool) and
+                additionalProperties):
+            return True
+        if not isinstance(additionalProperties, (dict, bool)):
+            return False
+
+        properties = node.params.get('properties', [])
+        if properties is None:
+            properties = {}
+        patternproperties = node.params.get('patternProperties', [])
+        matcher = self.matcher(patternproperties)
+        if matcher is None and patternproperties != []:
+            return False
+
+        key = self.var('k')
+        start = self.begin('if isinstance(%s, dict):' % ctx.v)
+        self.begin('for %s in %s:' % (key, ctx.v))
+        self.loops += 1
+        condition = '%s not in %s' % (key, self.const(properties))
+        if matcher is not None and matcher.patterns:
+            condition += ' and not %s.classify(%s)' % (self.const(matcher),
+                                                      key)
+        self.begin('if %s:' % condition)
+        if additionalProperties is False:
+            self.error(ctx, 'forbidden-property', key)
+        else:
+            self.node(additionalProperties, _Context(
+                ctx.v, key, ctx.parts + [(False, '_name(%s)' % key)], 'dict'))
+        self.loops -= 1
+        self.end(start + 2)
+        self.indent -= 2
+        return True
+
+    def _gen_patternProperties(self, node, ctx, patternproperties):
+        if patternproperties is None:
+            patternproperties = {}
+        if not patternproperties:
+            return isinstance(patternproperties, dict)
+        matcher = self.matcher(patternproperties)
+        if matcher is None:
+            return False
+
+        if ctx.exists:
+            value_obj = self.var('o')
+            self.line('%s = %s if %s else {}' % (value_obj, ctx.v,
+                                                 ctx.exists))
+        else:
+            value_obj = ctx.v
+
+        buckets = self.var('b')
+        self.line('%s = %s.buckets(%s.items())' % (
+            buckets, self.const(matcher), value_obj))
+        for index, schema in enumerate(patternproperties.values()):
+            key = self.var('k')
+            self.begin('for %s in %s[%d]:' % (key, buckets, index))
+            self.loops += 1
+            self.node(schema, _Context(
+                value_obj, key, ctx.parts + [(False, '_name(%s)' % key)],
+                'dict'))
+            self.loops -= 1
+            self.indent -= 1
+        return True
+
+    def _gen_additionalItems(self, node, ctx, additionalItems):
+        if isinstance(additionalItems, bool):
+            if additionalItems or 'items' not in node.params:
+                return True
+        elif (not isinstance(additionalItems, dict) or
+              'items' not in node.params or
+              any(_method(self.cls, name) is not _base(name) for name in
+                  ('validate_items', 'validate_required', 'validate_blank'))):
+            return False
+
+        try:
+            length = len(node.params['items'])
+        except TypeError:
+            return False
+
+        v = ctx.v
+        if additionalItems is False:
+            start = self.begin('if isinstance(%s, (list, tuple)) and '
+                               'len(%s) != %d:' % (v, v, length))
+            self.error(ctx, 'incorrect-list-length')
+            self.end(start)
+            return True
+
+        # the remaining items are validated as a document of their own,
+        # hence the '_data' in their path.
+        remaining, index, item = self.var('r'), self.var('i'), self.var('v')
+        start = self.begin('if isinstance(%s, (list, tuple)):' % v)
+        self.line('%s = %s[%d:]' % (remaining, v, length))
+        self.begin('for %s, %s in enumerate(%s):' % (index, item, remaining))
+        self.loops += 1
+        self.node(additionalItems, _Context(
+            remaining, index, ctx.parts + [
+                (True, '_data'), (False, "'[%%d]' %% %s" % index)],
+            'list', value=item))
+        self.loops -= 1
+        self.end(start + 2)
+        self.indent -= 1
+        return True
+
+    def _gen_extends(self, node, ctx, extends):
+        if _method(self.cls, 'validate_type') is not _base('validate_type'):
+            return False
+        return self.type_check(extends, ctx)
+
+
+class GeneratedSchema(CompiledSchema):
+    '''
+    A :class:`~validictory.CompiledSchema` validating documents with python
+    source generated for the schema, available as :attr:`source` for
+    inspection. The errors reported are the same as with the compiled
+    nodes.
+
+    Use :func:`~validictory.compile` with ``codegen=True`` to create one.
+    '''
+
+    def __init__(self, validator, schema):
+        super(GeneratedSchema, self).__init__(validator, schema)
+        generator = _Generator(self)
+        self.source = generator.generate()
+
+        namespace = generator.namespace
+        exec(compile(self.source, '<validictory schema>', 'exec'), namespace)
+        self._function = namespace['validate']
+
+    @property
+    def size(self):
+        return (super(GeneratedSchema, self).size +
+                2 * sys.getsizeof(self.source))
+
+    def _run(self, validator, data):
+        return self._function(validator, data)
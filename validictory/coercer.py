@@ -4,7 +4,7 @@
 import re
 from datetime import datetime
 
-from validator import SchemaValidator, SchemaError
+from validator import SchemaValidator, SchemaError, validate_many
 from extended import ExtendedSchemaValidator
 
 
@@ -35,6 +35,7 @@ class SchemaCoercer(SchemaValidator):
                     super(SchemaCoercer, self).validate_type(x, fieldname, schema, fieldtype)
                 else:
                     self.error_list += errs
+                    self._check_errors()
             else:
                 self._error('impossible-coercion', fieldtype)
 
@@ -103,7 +104,7 @@ class SchemaCoercer(SchemaValidator):
         value = self.get(x, fieldname)
         if isinstance(additionalProperties, (dict, bool)):
             properties = schema.get("properties", [])
-            patternProperties = schema.get('patternProperties', [])
+            matcher = self._matcher(schema.get('patternProperties', []))
             if properties is None:
                 properties = {}
             if value is None:
@@ -116,12 +117,7 @@ class SchemaCoercer(SchemaValidator):
                     continue
 
                 # Check if the property matches a patternProperty
-                matched = False
-                for pattern in patternProperties:
-                    if re.match(pattern, eachProperty):
-                        matched = True
-                        break
-                if matched:
+                if matcher.classify(eachProperty):
                     continue
 
                 # If additionalProperties is the boolean value False
@@ -143,3 +139,12 @@ class SchemaCoercer(SchemaValidator):
 
 class ExtendedSchemaCoercer(SchemaCoercer, ExtendedSchemaValidator):
     pass
+
+
+def coerce_many(iterable, schema, validator_cls=SchemaCoercer, **kw):
+    '''
+    Coerces each parsed json document of an iterable to the provided schema,
+    see :func:`~validictory.validate_many`: the ``data`` of the results are
+    the coerced documents.
+    '''
+    return validate_many(iterable, schema, validator_cls=validator_cls, **kw)
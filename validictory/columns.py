@@ -0,0 +1,190 @@
+'''
+    columns.py, validation of arrays of flat records a property at a time.
+
+    Validating an array of records item by item walks every record through
+    the schema of every property. When the properties are plain values
+    (``type``, ``enum``, bounds and lengths), the records are instead
+    transposed into one column per property, and each keyword is checked
+    over a whole column at once, only the failing values being reported.
+'''
+
+import sys
+
+if sys.version_info[0] == 3:
+    _str_type = str
+    _num_types = (int, float)
+else:
+    _str_type = basestring
+    _num_types = (int, long, float)
+
+
+class Column(object):
+    '''
+    The checks of the schema of one property of the records.
+
+    :param name: the name of the property
+    :param required: whether the property must be present
+    :param fieldtype: the ``type`` of the schema, for the errors
+    :param types: ``(exact, classes)``, the types of the values of that
+        ``type`` and the classes they may be instances of, or None when
+        the type isn't checked
+    :param checks: ``(keyword, value, exclusive)`` for the other keywords
+        of the schema, in the order they are checked, the value of ``enum``
+        being its :class:`~validictory.enumeration.Enumeration`
+    :param numeric: a :class:`~validictory.numeric.NumericItems` checking
+        the type and all of the keywords, if they are only about numbers
+    '''
+
+    def __init__(self, name, required, fieldtype, types, checks,
+                 numeric=None):
+        self.name = name
+        self.required = required
+        self.fieldtype = fieldtype
+        self.types = types
+        self.checks = checks
+        self.numeric = numeric
+
+    def failures(self, records):
+        '''
+        Returns a dict of the errors, as lists of ``(code, message,
+        suppl)``, of the records failing the checks by their position in
+        ``records``.
+        '''
+        values = [record.get(self.name, _MISSING) for record in records]
+        types = set(map(type, values))
+        failing = {}
+
+        missing = _Missing in types
+        if missing:
+            types.discard(_Missing)
+            if self.required:
+                for i, value in enumerate(values):
+                    if value is _MISSING:
+                        failing[i] = [('missing-required', None, None)]
+
+        if self.numeric is not None:
+            present = list(enumerate(values))
+            if missing:
+                present = [(i, value) for i, value in present
+                           if value is not _MISSING]
+                values = [value for i, value in present]
+            for position, errors in self.numeric.failures(values):
+                failing[present[position][0]] = errors
+            return failing
+
+        wrong_types = False
+        if self.types is not None and not all(
+                _of_types(cls, self.types) for cls in types):
+            for i, value in enumerate(values):
+                if (value is not _MISSING and
+                        not _of_types(type(value), self.types)):
+                    failing[i] = [('incorrect-type', self.fieldtype, value)]
+                    wrong_types = True
+
+        # the keywords don't check missing and null values
+        if missing or wrong_types or type(None) in types:
+            present = [(i, value) for i, value in enumerate(values)
+                       if value is not None and value is not _MISSING and
+                       not (wrong_types and i in failing)]
+        else:
+            present = list(enumerate(values))
+
+        for keyword, bound, exclusive in self.checks:
+            for i, value, error in _check(present, keyword, bound,
+                                          exclusive):
+                failing.setdefault(i, []).append(error)
+
+        return failing
+
+
+class _Missing(object):
+    '''
+    The value of the properties missing from a record.
+    '''
+
+_MISSING = _Missing()
+
+
+def _of_types(cls, types):
+    exact, classes = types
+    return cls in exact or (classes and issubclass(cls, classes))
+
+
+def _check(present, keyword, bound, exclusive):
+    if keyword == 'enum':
+        return [(i, v, ('not-in-enumeration', bound.options, v))
+                for i, v in present if v not in bound]
+    if keyword == 'minimum':
+        if exclusive:
+            failing = [(i, v) for i, v in present if v <= bound]
+        else:
+            failing = [(i, v) for i, v in present
+                       if type(v) in (int, float) and v < bound]
+        return [(i, v, ('less-than-minimum', bound, v)) for i, v in failing]
+    if keyword == 'maximum':
+        if exclusive:
+            failing = [(i, v) for i, v in present if v >= bound]
+        else:
+            failing = [(i, v) for i, v in present
+                       if type(v) in (int, float) and v > bound]
+        return [(i, v, ('more-than-maximum', bound, v)) for i, v in failing]
+    if keyword == 'divisibleBy':
+        return [(i, v, ('not-divisible-by', bound, v)) for i, v in present
+                if type(v) in _num_types and v % bound != 0]
+    if keyword == 'minLength':
+        return [(i, v, ('too-short', bound, len(v))) for i, v in present
+                if isinstance(v, (_str_type, list, tuple)) and len(v) < bound]
+    if keyword == 'maxLength':
+        return [(i, v, ('too-long', bound, len(v))) for i, v in present
+                if isinstance(v, (_str_type, list, tuple)) and len(v) > bound]
+    # blank
+    return [(i, v, ('blank', None, None)) for i, v in present
+            if isinstance(v, _str_type) and not v]
+
+
+class RecordColumns(object):
+    '''
+    The checks of an ``items`` schema of records with plain properties, as
+    validated by :class:`~validictory.SchemaValidator`.
+
+    :param fieldtype: the ``type`` of the records, for the errors
+    :param types: ``(exact, classes)`` for that ``type``, dicts being of it
+    :param columns: the :class:`Column` of each property, in the order they
+        are validated
+    '''
+
+    def __init__(self, fieldtype, types, columns):
+        self.fieldtype = fieldtype
+        self.types = types
+        self.columns = columns
+
+    def failures(self, records):
+        '''
+        Returns the ``(index, errors)`` of the records failing the checks,
+        ``errors`` being a list of ``(code, message, suppl, name)``, or None
+        if the records can't be validated a column at a time.
+        '''
+        failing = {}
+        dicts = records
+        indexes = None
+        if set(map(type, records)) != set([dict]):
+            dicts, indexes = [], []
+            for index, record in enumerate(records):
+                if type(record) is dict:
+                    dicts.append(record)
+                    indexes.append(index)
+                elif not _of_types(type(record), self.types):
+                    failing[index] = [('incorrect-type', self.fieldtype,
+                                       record, None)]
+                elif isinstance(record, dict):
+                    # subclasses may look up values their own way
+                    return None
+
+        for column in self.columns:
+            name = column.name
+            for position, errors in column.failures(dicts).items():
+                index = indexes[position] if indexes is not None else position
+                failing.setdefault(index, []).extend(
+                    error + (name,) for error in errors)
+
+        return sorted(failing.items())
@@ -0,0 +1,42 @@
+'''
+    enumeration.py, membership tests for the ``enum`` of a schema.
+
+    Looking a value up in the list of an ``enum`` compares it with each
+    option in turn. The options are instead put in a set once, when the
+    schema is compiled, the options that can't be hashed (lists and
+    objects) being kept apart and compared with the values one by one.
+'''
+
+
+class Enumeration(object):
+    '''
+    The options of an ``enum``, telling whether a value is one of them just
+    as ``value in options`` does: ``1``, ``1.0`` and ``True`` are equal.
+
+    :param options: the container of the ``enum``, only lists and tuples
+        are put in a set
+    '''
+
+    def __init__(self, options):
+        self.options = options
+        self.hashables = None
+        self.unhashables = []
+
+        if isinstance(options, (list, tuple)):
+            self.hashables = set()
+            for option in options:
+                try:
+                    self.hashables.add(option)
+                except TypeError:
+                    self.unhashables.append(option)
+
+    def __contains__(self, value):
+        if self.hashables is None:
+            return value in self.options
+        try:
+            if value in self.hashables:
+                return True
+        except TypeError:
+            # a list or an object, compared with all of the options
+            return value in self.options
+        return bool(self.unhashables) and value in self.unhashables
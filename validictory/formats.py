@@ -0,0 +1,142 @@
+'''
+    formats.py, the validators of the string formats of json schema beyond
+    the dates and times: ``email``, ``uri``, ``hostname``, ``ipv6``,
+    ``uuid`` and ``color``.
+
+    Each format is checked with regular expressions compiled once, and
+    plain tests rather than exceptions; values that aren't strings are not
+    in any of these formats.
+'''
+
+import re
+import sys
+
+if sys.version_info[0] == 3:
+    _str_type = str
+else:
+    _str_type = basestring
+
+
+def _error(validator, fieldname, value, format_option):
+    validator.error_list.append(
+        "Value %(value)r of field '%(fieldname)s' is not in "
+        "'%(format_option)s' format" % locals())
+
+
+def _generate_format_validator(test):
+    def validate_format(validator, fieldname, value, format_option):
+        if not isinstance(value, _str_type) or not test(value):
+            _error(validator, fieldname, value, format_option)
+
+    return validate_format
+
+
+# RFC 1123, a dot may end the name
+_LABEL = r'[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?'
+_HOSTNAME = re.compile(r'%s(?:\.%s)*\.?\Z' % (_LABEL, _LABEL))
+
+
+def _is_hostname(value):
+    '''
+    A host name of labels of letters, digits and hyphens.
+    '''
+    return len(value) <= 253 and _HOSTNAME.match(value) is not None
+
+
+# the dot-atoms of RFC 5322, without comments or quoted strings
+_ATOM = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+"
+_LOCAL_PART = re.compile(r'%s(?:\.%s)*\Z' % (_ATOM, _ATOM))
+
+
+def _is_email(value):
+    '''
+    An email address, ``local-part@hostname``.
+    '''
+    local, at, domain = value.rpartition('@')
+    return (bool(at) and len(local) <= 64 and
+            _LOCAL_PART.match(local) is not None and _is_hostname(domain))
+
+
+# RFC 3986, the characters allowed in a uri and percent-encoded octets
+_URI = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:"
+                  r"(?:[A-Za-z0-9._~:/?#\[\]@!$&'()*+,;=-]|%[0-9A-Fa-f]{2})*\Z")
+
+
+def _is_uri(value):
+    '''
+    An absolute uri, made of a scheme and of the characters allowed in a
+    uri.
+    '''
+    return _URI.match(value) is not None
+
+
+_IPV4 = re.compile(r'(?:(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}'
+                   r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\Z')
+_HEXTET = re.compile(r'[0-9A-Fa-f]{1,4}\Z')
+
+
+def _is_ipv4(value):
+    '''
+    An IPv4 address in dotted decimal notation.
+    '''
+    return _IPV4.match(value) is not None
+
+
+def _is_ipv6(value):
+    '''
+    An IPv6 address of RFC 4291, shortened with ``::`` or ending with an
+    IPv4 address.
+    '''
+    head, shortened, tail = value.partition('::')
+    if shortened and '::' in tail:
+        return False
+    groups = head.split(':') if head else []
+    if tail:
+        groups += tail.split(':')
+    size = len(groups)
+    if groups and (tail or not shortened) and '.' in groups[-1]:
+        # the last two groups as an IPv4 address
+        if not _is_ipv4(groups.pop()):
+            return False
+        size += 1
+    for group in groups:
+        if not _HEXTET.match(group):
+            return False
+    return size < 8 if shortened else size == 8
+
+
+_UUID = re.compile(r'[0-9A-Fa-f]{8}-(?:[0-9A-Fa-f]{4}-){3}[0-9A-Fa-f]{12}\Z')
+
+
+def _is_uuid(value):
+    '''
+    A UUID of RFC 4122 in its hexadecimal form.
+    '''
+    return _UUID.match(value) is not None
+
+
+# CSS 2.1
+_COLOR_NAMES = frozenset([
+    'aqua', 'black', 'blue', 'fuchsia', 'gray', 'green', 'lime', 'maroon',
+    'navy', 'olive', 'orange', 'purple', 'red', 'silver', 'teal', 'white',
+    'yellow'])
+_COLOR = re.compile(
+    r'#(?:[0-9A-Fa-f]{3}){1,2}\Z|'
+    r'rgb\(\s*(?:[+-]?[0-9]+\s*,\s*){2}[+-]?[0-9]+\s*\)\Z|'
+    r'rgb\(\s*(?:[+-]?[0-9]+(?:\.[0-9]+)?%\s*,\s*){2}[+-]?[0-9]+(?:\.[0-9]+)?%\s*\)\Z',
+    re.IGNORECASE)
+
+
+def _is_color(value):
+    '''
+    A CSS 2.1 color: one of its names, ``#rgb``, ``#rrggbb`` or ``rgb()``.
+    '''
+    return value.lower() in _COLOR_NAMES or _COLOR.match(value) is not None
+
+
+validate_format_email = _generate_format_validator(_is_email)
+validate_format_uri = _generate_format_validator(_is_uri)
+validate_format_hostname = _generate_format_validator(_is_hostname)
+validate_format_ipv6 = _generate_format_validator(_is_ipv6)
+validate_format_uuid = _generate_format_validator(_is_uuid)
+validate_format_color = _generate_format_validator(_is_color)
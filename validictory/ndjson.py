@@ -0,0 +1,176 @@
+'''
+    ndjson.py, validation of newline delimited json, one document per line.
+
+    Each line is parsed and validated on its own, in this process or over a
+    pool of processes (see :mod:`validictory.parallel`), the lines being
+    parsed by the workers as well. A file can be memory-mapped and split
+    into ranges of lines that each worker reads from the mapping itself.
+'''
+
+import os
+import json
+import mmap
+import multiprocessing
+
+import parallel
+from validator import SchemaValidator, ValidationResult, compile
+
+
+def _line_results(compiled, lines):
+    '''
+    Returns the ``(number, result)`` of a list of numbered lines, the
+    documents being validated all at once.
+    '''
+    documents = []
+    failed = {}
+    for number, line in lines:
+        try:
+            documents.append(json.loads(line))
+        except ValueError as e:
+            failed[number] = ValidationResult(
+                False, [('invalid-json', None, str(e), None)], None)
+    results = compiled.validate_many(documents)
+    return [(number, failed.pop(number) if number in failed
+             else next(results)) for number, line in lines]
+
+
+def _validate_lines(chunk):
+    # the chunks pair the numbered lines with their position
+    return _line_results(parallel._compiled, [line for _, line in chunk])
+
+
+def validate_lines(lines, schema, workers=1, chunksize=256,
+                   validator_cls=SchemaValidator, format_validators=None,
+                   required_by_default=False, blank_by_default=False,
+                   ignore_required=False, fail_fast=False, max_errors=None):
+    '''
+    Parses and validates each line of an iterable of json lines (such as a
+    file) against the provided schema, and returns an iterator of
+    ``(line, result)`` pairs in the order of the lines, ``line`` being the
+    line number (from 1) and ``result`` its :class:`ValidationResult`.
+    Takes the same options as :func:`validate`. Blank lines are skipped.
+
+    A line that isn't json fails with an ``invalid-json`` error. With more
+    than one worker the lines are parsed and validated over a pool of
+    ``workers`` processes (one per CPU if None), sent ``chunksize`` at a
+    time.
+
+    If there is an issue in the schema a :class:`SchemaError` will be raised.
+    '''
+    options = dict(format_validators=format_validators,
+                   required_by_default=required_by_default,
+                   blank_by_default=blank_by_default,
+                   ignore_required=ignore_required,
+                   fail_fast=fail_fast, max_errors=max_errors)
+    compiled = compile(schema, validator_cls, **options)
+
+    numbered = ((number, line) for number, line in enumerate(lines, 1)
+                if line.strip())
+    if workers == 1:
+        return (result for chunk in parallel._chunks(numbered, chunksize)
+                for result in _line_results(compiled, chunk))
+    return parallel._results(numbered, schema, validator_cls, options,
+                             workers or multiprocessing.cpu_count(),
+                             chunksize, True, _validate_lines)
+
+
+# the files mapped in a worker process, by path
+_maps = {}
+
+
+def _map(path):
+    with open(path, 'rb') as fp:
+        return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _ranges(mapping, rangesize):
+    start = 0
+    while start < len(mapping):
+        end = mapping.find('\n', start + rangesize) + 1 or len(mapping)
+        yield start, end
+        start = end
+
+
+def _scan_range(compiled, mapping, start, end):
+    '''
+    Returns the number of lines of a range of a mapped file and the
+    ``(index, offset, result)`` of its lines, ``index`` counting from the
+    start of the range.
+    '''
+    text = mapping[start:end]
+    numbered = []
+    offset = start
+    for index, line in enumerate(text.split('\n')):
+        if line.strip():
+            numbered.append(((index, offset), line))
+        offset += len(line) + 1
+    return text.count('\n'), [
+        (index, position, ValidationResult(valid, errors, None))
+        for (index, position), (valid, errors, _) in _line_results(compiled,
+                                                                   numbered)]
+
+
+def _scan_ranges(chunk):
+    results = []
+    for _, (path, start, end) in chunk:
+        if path not in _maps:
+            _maps[path] = _map(path)
+        results.append(_scan_range(parallel._compiled, _maps[path], start,
+                                   end))
+    return results
+
+
+def validate_file(path, schema, workers=None, rangesize=1 << 20,
+                  validator_cls=SchemaValidator, format_validators=None,
+                  required_by_default=False, blank_by_default=False,
+                  ignore_required=False, fail_fast=False, max_errors=None):
+    '''
+    Validates each line of a newline delimited json file against the
+    provided schema, and returns an iterator of ``(line, offset, result)``
+    in the order of the lines, ``line`` being the line number (from 1),
+    ``offset`` the position of the line in the file and ``result`` its
+    :class:`ValidationResult`, without the data. Takes the same options as
+    :func:`validate`. Blank lines are skipped.
+
+    The file is memory-mapped and split into ranges of about ``rangesize``
+    bytes ending with a line, each of the ``workers`` processes (one per
+    CPU if None) validating a range at a time straight from its own
+    mapping of the file, so that only the results go through the pool.
+
+    If there is an issue in the schema a :class:`SchemaError` will be raised.
+    '''
+    options = dict(format_validators=format_validators,
+                   required_by_default=required_by_default,
+                   blank_by_default=blank_by_default,
+                   ignore_required=ignore_required,
+                   fail_fast=fail_fast, max_errors=max_errors)
+    compiled = compile(schema, validator_cls, **options)
+    return _scan(path, compiled, workers, rangesize, schema, validator_cls,
+                 options)
+
+
+def _scan(path, compiled, workers, rangesize, schema, validator_cls,
+          options):
+    if not os.path.getsize(path):
+        # there's nothing to map
+        return
+    mapping = _map(path)
+    try:
+        if workers == 1:
+            scanned = (_scan_range(compiled, mapping, start, end)
+                       for start, end in _ranges(mapping, rangesize))
+        else:
+            ranges = ((path, start, end)
+                      for start, end in _ranges(mapping, rangesize))
+            scanned = parallel._results(
+                ranges, schema, validator_cls, options,
+                workers or multiprocessing.cpu_count(), 1, True,
+                _scan_ranges)
+
+        first = 1
+        for count, results in scanned:
+            for index, offset, result in results:
+                yield first + index, offset, result
+            first += count
+    finally:
+        mapping.close()
@@ -0,0 +1,142 @@
+'''
+    numeric.py, validation of arrays of numbers all at once.
+
+    An ``items`` schema made only of a numeric ``type`` and of ``minimum``,
+    ``maximum`` and ``divisibleBy`` doesn't need each item to go through the
+    schema: each keyword is checked over the whole array, with NumPy when it
+    is installed and the array is large enough, with list comprehensions
+    otherwise, and only the failing items are reported.
+'''
+
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if sys.version_info[0] == 3:
+    _int_types = (int,)
+    _long_types = ()
+else:
+    _int_types = (int, long)
+    _long_types = (long,)
+
+
+# floats represent integers exactly up to there
+_EXACT_FLOAT = 2 ** 53
+
+
+def _exact(bound):
+    return type(bound) is float or (
+        type(bound) in _int_types and abs(bound) <= _EXACT_FLOAT)
+
+
+class NumericItems(object):
+    '''
+    The checks of a numeric ``items`` schema, as validated by
+    :class:`~validictory.SchemaValidator`.
+
+    :param fieldtype: the ``type`` of the schema, for the errors
+    :param types: the python types of the values of that ``type``
+    :param checks: ``(keyword, value, exclusive)`` for the ``minimum``,
+        ``maximum`` and ``divisibleBy`` of the schema, in the order they are
+        checked
+    '''
+
+    numpy_threshold = 1000
+
+    def __init__(self, fieldtype, types, checks):
+        self.fieldtype = fieldtype
+        self.types = frozenset(types)
+        self.checks = checks
+
+    def failures(self, values):
+        '''
+        Returns the ``(index, errors)`` of the items of ``values`` failing
+        the checks, ``errors`` being a list of ``(code, message, suppl)``.
+        '''
+        types = set(map(type, values))
+        if not types <= self.types:
+            # the items of the wrong type fail on that alone
+            return self._python(values, [
+                index for index, value in enumerate(values)
+                if type(value) not in self.types])
+
+        if (numpy is not None and len(values) >= self.numpy_threshold and
+                types.isdisjoint(_long_types) and
+                all(_exact(check[1]) for check in self.checks)):
+            return self._numpy(values, types)
+        return self._python(values, [])
+
+    def _python(self, values, wrong_types):
+        failing = {}
+        for index in wrong_types:
+            failing[index] = [('incorrect-type', self.fieldtype,
+                               values[index])]
+
+        items = [(index, value) for index, value in enumerate(values)
+                 if index not in failing] if failing else enumerate(values)
+        items = list(items)
+
+        for keyword, bound, exclusive in self.checks:
+            if keyword == 'minimum':
+                if exclusive:
+                    indexes = [i for i, v in items if v <= bound]
+                else:
+                    indexes = [i for i, v in items
+                               if type(v) in (int, float) and v < bound]
+                code = 'less-than-minimum'
+            elif keyword == 'maximum':
+                if exclusive:
+                    indexes = [i for i, v in items if v >= bound]
+                else:
+                    indexes = [i for i, v in items
+                               if type(v) in (int, float) and v > bound]
+                code = 'more-than-maximum'
+            else:
+                indexes = [i for i, v in items if v % bound != 0]
+                code = 'not-divisible-by'
+
+            for index in indexes:
+                failing.setdefault(index, []).append(
+                    (code, bound, values[index]))
+
+        return sorted(failing.items())
+
+    def _numpy(self, values, types):
+        floats = float in types
+        array = numpy.array(values, dtype=float)
+        if int in types:
+            if floats:
+                big = any(abs(value) >= _EXACT_FLOAT for value in values
+                          if type(value) is int)
+            else:
+                big = abs(array).max() >= _EXACT_FLOAT
+            if big:
+                # some integers didn't make it to floats
+                return self._python(values, [])
+
+        failing = {}
+        with numpy.errstate(invalid='ignore'):
+            for keyword, bound, exclusive in self.checks:
+                if keyword == 'minimum':
+                    mask = array <= bound if exclusive else array < bound
+                    code = 'less-than-minimum'
+                elif keyword == 'maximum':
+                    mask = array >= bound if exclusive else array > bound
+                    code = 'more-than-maximum'
+                else:
+                    if floats or type(bound) is float:
+                        mask = numpy.remainder(array, bound) != 0
+                    else:
+                        mask = numpy.remainder(
+                            numpy.array(values, dtype=numpy.int64),
+                            bound) != 0
+                    code = 'not-divisible-by'
+
+                for index in numpy.flatnonzero(mask).tolist():
+                    failing.setdefault(index, []).append(
+                        (code, bound, values[index]))
+
+        return sorted(failing.items())
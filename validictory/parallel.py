@@ -0,0 +1,114 @@
+'''
+    parallel.py, validation of many documents over a pool of processes.
+
+    The schema and the validation options are handed to each worker process
+    once, when it starts, and compiled there; only the documents and their
+    results travel between the processes afterwards.
+'''
+
+import sys
+import itertools
+import threading
+import multiprocessing
+
+from validator import SchemaValidator, compile, _reraise
+
+# the schema compiled in a worker process, see _init
+_compiled = None
+
+
+def _init(schema, validator_cls, options):
+    global _compiled
+    _compiled = compile(schema, validator_cls, **options)
+
+
+def _validate_chunk(chunk):
+    indexes, documents = zip(*chunk)
+    return zip(indexes, _compiled.validate_many(documents))
+
+
+def _chunks(items, chunksize):
+    while True:
+        chunk = list(itertools.islice(items, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_parallel(iterable, schema, workers=None, chunksize=256,
+                      ordered=True, validator_cls=SchemaValidator,
+                      format_validators=None, required_by_default=False,
+                      blank_by_default=False, ignore_required=False,
+                      fail_fast=False, max_errors=None):
+    '''
+    Validates each parsed json document of an iterable against the provided
+    schema, over a pool of ``workers`` processes (one per CPU by default),
+    and returns an iterator of ``(index, result)`` pairs, ``index`` being the
+    position of the document in the iterable and ``result`` its
+    :class:`ValidationResult`. Takes the same options as :func:`validate`,
+    ``validator_cls`` can be any :class:`SchemaValidator` subclass,
+    coercers included.
+
+    The documents are sent to the workers ``chunksize`` at a time, and the
+    results come back in the order of the documents, or as soon as they are
+    ready if ``ordered`` is False. The iterable is read a few chunks per
+    worker ahead of the results.
+
+    If there is an issue in the schema a :class:`SchemaError` will be raised.
+    '''
+    options = dict(format_validators=format_validators,
+                   required_by_default=required_by_default,
+                   blank_by_default=blank_by_default,
+                   ignore_required=ignore_required,
+                   fail_fast=fail_fast, max_errors=max_errors)
+    # report schema errors right away rather than from the workers
+    compile(schema, validator_cls, **options)
+
+    return _results(iterable, schema, validator_cls, options,
+                    workers or multiprocessing.cpu_count(), chunksize,
+                    ordered)
+
+
+def _results(iterable, schema, validator_cls, options, workers, chunksize,
+             ordered, validate_chunk=_validate_chunk):
+    '''
+    Yields the results of ``validate_chunk`` over chunks of ``(index,
+    item)`` pairs of the iterable, in a pool of ``workers`` processes.
+    '''
+    chunks = _chunks(enumerate(iterable), chunksize)
+    # a chunk is only handed to the pool once the results of another have
+    # been taken, keeping a few chunks per worker in flight
+    window = threading.Semaphore(workers * 4)
+    stopped = []
+    # what reading the iterable raised, from the pool's task thread
+    failed = []
+
+    def submitted():
+        while True:
+            window.acquire()
+            try:
+                chunk = next(chunks, None) if not stopped else None
+            except Exception:
+                failed.append(sys.exc_info())
+                return
+            if chunk is None:
+                return
+            yield chunk
+
+    pool = multiprocessing.Pool(workers, _init,
+                                (schema, validator_cls, options))
+    try:
+        imap = pool.imap if ordered else pool.imap_unordered
+        for results in imap(validate_chunk, submitted()):
+            window.release()
+            for result in results:
+                yield result
+        if failed:
+            _reraise(failed[0])
+        pool.close()
+    finally:
+        # let the pool's task thread out of submitted() if it is waiting
+        stopped.append(True)
+        window.release()
+        pool.terminate()
+        pool.join()
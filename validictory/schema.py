@@ -3,7 +3,7 @@
     with more python types and formats.
 '''
 
-from validator import SchemaValidator, validate
+from validator import SchemaValidator, validate, _frozen
 from extended import ExtendedSchemaValidator
 from coercer import SchemaCoercer, ExtendedSchemaCoercer
 
@@ -21,12 +21,67 @@ def Either(*types, **kw):
             )
         )
     '''
-    return dict(
+    return FrozenDict(
         type=types,
         **kw
     )
 
 
+_new = dict.__new__
+_update = dict.update
+_setitem = dict.__setitem__
+
+
+def _rebuild(cls, items, changes=None):
+    '''
+    Returns a ``cls`` with the ``items``, updated with ``changes``: the
+    values are shared, only the dict itself is new.
+    '''
+    obj = _new(cls)
+    _update(obj, items)
+    if changes:
+        _update(obj, changes)
+    return obj
+
+
+def _with(element, key, value):
+    '''
+    Returns a copy of an element with ``key`` set to ``value``, sharing the
+    other values.
+    '''
+    obj = _new(element.__class__)
+    _update(obj, element)
+    _setitem(obj, key, value)
+    return obj
+
+
+def _immutable(self, *a, **kw):
+    raise TypeError("%s objects are immutable" % self.__class__.__name__)
+
+
+class FrozenDict(dict):
+    '''
+    A dict that can't be modified once built, and so can be hashed. Its hash
+    is worked out once, from its contents.
+    '''
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = \
+        update = _immutable
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(_frozen(self))
+            return self._hash
+
+    def __reduce__(self):
+        return _rebuild, (self.__class__, dict(self))
+
+    def copy(self):
+        return _rebuild(self.__class__, self)
+
+
 class MetaSchemaElement(type):
 
     def __new__(cls, name, bases, dct):
@@ -46,9 +101,10 @@ class MetaSchemaElement(type):
                 realname = attr[1]
 
             def method(self, val=default):
-                res = self.copy()
-                res[realname] = val
-                return res
+                obj = _new(self.__class__)
+                _update(obj, self)
+                _setitem(obj, realname, val)
+                return obj
 
             method.__name__ = methodname
             return method
@@ -59,56 +115,52 @@ class MetaSchemaElement(type):
         return super(MetaSchemaElement, cls).__new__(cls, name, bases, dct)
 
 
-class SchemaElement(dict):
+class SchemaElement(FrozenDict):
+    '''
+    A schema that can't be modified: each method or property returns a new
+    element, sharing the values it leaves as they are. Elements are
+    hashable, and can key caches.
+    '''
     type = ''
 
     attrs = [
-        ('dependencies', []),
+        ('dependencies', ()),
         ('default',)
     ]
 
     __metaclass__ = MetaSchemaElement
 
     def __init__(self):
-        self['type'] = self.type
+        dict.__setitem__(self, 'type', self.type)
 
     def __call__(self, *a, **kw):
         newobj = self.__class__(*a, **kw)
 
         for k, v in self.items():
             if not k in newobj:
-                newobj[k] = v
-
-        return newobj
+                dict.__setitem__(newobj, k, v)
 
-    def copy(self):
-        newobj = self.__class__()
-        for k, v in self.items():
-            newobj[k] = v
         return newobj
 
     @property
     def required(self):
-        cp = self.copy()
-        cp['required'] = True
-        return cp
+        return _with(self, 'required', True)
 
     @property
     def not_required(self):
-        cp = self.copy()
-        cp['required'] = False
-        return cp
+        return _with(self, 'required', False)
 
     @property
     def nullable(self):
         ''' Should be the last one to be called '''
-        return dict(
-            type=[self, {'type': 'null'}]
+        return FrozenDict(
+            type=(self, FrozenDict(type='null'))
         )
 
     def _validate(self, data, validator_cls=SchemaValidator,
              format_validators=None, required_by_default=False,
-             blank_by_default=False, ignore_required=False):
+             blank_by_default=False, ignore_required=False,
+             fail_fast=False, max_errors=None):
         return validate(
             data,
             self,
@@ -116,7 +168,9 @@ class SchemaElement(dict):
             format_validators=format_validators,
             required_by_default=required_by_default,
             blank_by_default=blank_by_default,
-            ignore_required=ignore_required
+            ignore_required=ignore_required,
+            fail_fast=fail_fast,
+            max_errors=max_errors
         )
 
     def validate(self, data, **kw):
@@ -130,8 +184,8 @@ class _Object(SchemaElement):
     type = 'object'
 
     attrs = [
-        ('properties', {}),
-        ('patterns', 'patternProperties', {}),
+        ('properties', FrozenDict()),
+        ('patterns', 'patternProperties', FrozenDict()),
         ('additionalProperties', 'additionalProperties', True),
         ('min_props', 'minProperties', 0),
         ('max_props', 'maxProperties', 0),
@@ -139,30 +193,31 @@ class _Object(SchemaElement):
 
     def __init__(self, *propdicts, **kw):
         super(_Object, self).__init__()
-        self['properties'] = {}
+        properties = _new(FrozenDict)
         for propdict in propdicts:
-            self['properties'].update(propdict)
-        self['properties'].update(kw)
+            _update(properties, propdict)
+        _update(properties, kw)
+        _setitem(self, 'properties', properties)
 
     def pattern(self, regexp, type):
-        if not 'patternProperties' in self:
-            self['patternProperties'] = {}
-        self['patternProperties'][regexp] = type
-        return self
+        patterns = _rebuild(FrozenDict, self.get('patternProperties', ()),
+                            {regexp: type})
+        return _with(self, 'patternProperties', patterns)
 
     def require_either(self, *a):
-        self['requireEither'] = a
-        return self
+        return _with(self, 'requireEither', a)
 
     def merge(self, other):
-        for k, v in other.get('properties', {}).items():
-            self['properties'][k] = v
+        changes = {}
+        if other.get('properties'):
+            changes['properties'] = _rebuild(
+                FrozenDict, self['properties'], other['properties'])
 
-        if other.get('patternProperties', None) and not 'patternProperties' in self:
-            self['patternProperties'] = {}
-        for k, v in other.get('patternProperties', {}).items():
-            self['patternProperties'][k] = v
-        return self
+        if other.get('patternProperties'):
+            changes['patternProperties'] = _rebuild(
+                FrozenDict, self.get('patternProperties', ()),
+                other['patternProperties'])
+        return _rebuild(self.__class__, self, changes) if changes else self
 
 
 class _StrictObject(_Object):
@@ -171,7 +226,7 @@ class _StrictObject(_Object):
 
     def __init__(self, **kw):
         super(_StrictObject, self).__init__(**kw)
-        self['additionalProperties'] = False
+        dict.__setitem__(self, 'additionalProperties', False)
 
 
 class _Array(SchemaElement):
@@ -185,9 +240,9 @@ class _Array(SchemaElement):
     )
 
     def __init__(self, items=None):
-        self['type'] = 'array'
+        super(_Array, self).__init__()
         if items:
-            self['items'] = items
+            dict.__setitem__(self, 'items', items)
 
 
 class _Number(SchemaElement):
@@ -225,21 +280,17 @@ class _String(SchemaElement):
     )
 
     def enum(self, *args):
-        cp = self.copy()
         enum = []
         for a in args:
             if isinstance(a, (tuple, list)):
                 enum += a
             else:
                 enum.append(a)
-        cp['enum'] = enum
-        return cp
+        return _with(self, 'enum', tuple(enum))
 
     @property
     def allow_blank(self):
-        cp = self.copy()
-        cp['blank'] = True
-        return cp
+        return _with(self, 'blank', True)
 
 
 class _Any(SchemaElement):
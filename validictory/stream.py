@@ -0,0 +1,221 @@
+'''
+    stream.py, validation of a json array read a piece at a time.
+
+    A document made of a (possibly huge) array is parsed one item at a
+    time and the items are validated as soon as a batch of them is parsed,
+    so that only that batch is kept in memory rather than the whole
+    document.
+'''
+
+import sys
+import json
+import itertools
+
+from validator import (SchemaValidator, ValidationError, compile, _cached,
+                       _str_type)
+
+_WHITESPACE = ' \t\n\r'
+if sys.version_info[0] == 3:
+    _NUMBERS = (int, float)
+else:
+    _NUMBERS = (int, long, float)
+_NUMBER_CHARS = '0123456789.eE+-'
+
+# the number of items validated at once
+_BATCH = 1000
+
+# the keywords of the schema of an array that can be checked without
+# keeping its items
+_STREAMED = ('type', 'items', 'minItems', 'maxItems', 'title', 'description',
+             'blank', 'required', 'default')
+
+
+class _Reader(object):
+    '''
+    The text of a json document read from a file ``chunksize`` bytes at a
+    time.
+    '''
+
+    def __init__(self, fp, chunksize):
+        self.fp = fp
+        self.chunksize = chunksize
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def read(self, size=None):
+        '''
+        Reads more of the document, returns False at its end.
+        '''
+        if self.eof:
+            return False
+        chunk = self.fp.read(size or self.chunksize)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        '''
+        Skips whitespace, returns the next character or '' at the end.
+        '''
+        while True:
+            while (self.pos < len(self.buffer) and
+                   self.buffer[self.pos] in _WHITESPACE):
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self.read():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def rest(self):
+        '''
+        Returns the rest of the document.
+        '''
+        return self.buffer[self.pos:] + self.fp.read()
+
+
+def iter_array(fp, chunksize=65536, decoder=None):
+    '''
+    Returns an iterator of the items of the json array read from the file
+    ``fp``, parsed one at a time. Raises a ValueError if the document isn't
+    an array or isn't valid json.
+    '''
+    reader = _Reader(fp, chunksize)
+    if reader.peek() != '[':
+        raise ValueError('The document is not an array')
+    reader.pos += 1
+    return _items(reader, decoder or json.JSONDecoder())
+
+
+def _items(reader, decoder):
+    first = True
+    while True:
+        char = reader.peek()
+        if char == ']':
+            reader.pos += 1
+            if reader.peek():
+                raise ValueError('Extra data after the array')
+            return
+        if not first:
+            if char != ',':
+                raise ValueError('Expecting , delimiter at %d' % reader.pos)
+            reader.pos += 1
+            reader.peek()
+        first = False
+
+        size = reader.chunksize
+        while True:
+            try:
+                item, end = decoder.raw_decode(reader.buffer, reader.pos)
+            except ValueError:
+                if not reader.read(size):
+                    raise
+            else:
+                # a number could go on in the text yet to be read
+                if (type(item) not in _NUMBERS or
+                        (end < len(reader.buffer) and
+                         reader.buffer[end] not in _NUMBER_CHARS) or
+                        not reader.read(size)):
+                    break
+            size *= 2
+        reader.pos = end
+        yield item
+
+
+def streamable(schema):
+    '''
+    Tells whether the documents of a schema can be validated a piece at a
+    time by :func:`validate_stream`: schemas of arrays checking their items
+    against a single schema, and their number of items.
+    '''
+    if not isinstance(schema, dict) or not set(schema) <= set(_STREAMED):
+        return False
+    fieldtype = schema.get('type')
+    if isinstance(fieldtype, (list, tuple)):
+        if not all(isinstance(t, _str_type) for t in fieldtype):
+            return False
+    elif fieldtype is not None and not isinstance(fieldtype, _str_type):
+        return False
+    return isinstance(schema.get('items', {}), dict)
+
+
+def validate_stream(fp, schema, validator_cls=SchemaValidator,
+                    format_validators=None, required_by_default=False,
+                    blank_by_default=False, ignore_required=False,
+                    fail_fast=False, max_errors=None, chunksize=65536):
+    '''
+    Validates the json document read from the file ``fp`` against the
+    provided schema. Takes the same options as :func:`validate`.
+
+    When the document is an array and the schema :func:`streamable`, the
+    items are parsed one at a time and validated a thousand at a time,
+    keeping none of them afterwards, the errors about the number of items
+    being reported after those of the items. Other documents are loaded
+    whole and validated as usual.
+
+    Returns the number of items validated a batch at a time (or None) and
+    raises a :class:`ValidationError` if the document isn't valid.
+    '''
+    options = dict(format_validators=format_validators,
+                   required_by_default=required_by_default,
+                   blank_by_default=blank_by_default,
+                   ignore_required=ignore_required,
+                   fail_fast=fail_fast, max_errors=max_errors)
+    reader = _Reader(fp, chunksize)
+
+    items = schema.get('items') if isinstance(schema, dict) else None
+    if streamable(schema) and reader.peek() == '[':
+        compiled = compile(schema, validator_cls, **options)
+        # the type has to allow arrays, and the items can't be required, as
+        # that is about the values of the array
+        node = compiled.nodes.get(id(items))
+        if (compile({'type': schema.get('type')}, validator_cls,
+                    **options).is_valid([]) and
+                (node is None or node.required is None)):
+            reader.pos += 1
+            return _validate_items(_items(reader, json.JSONDecoder()),
+                                   schema, items, validator_cls, options)
+
+    _cached(schema, validator_cls, **options).validate(
+        json.loads(reader.rest()))
+
+
+def _validate_items(items, schema, items_schema, validator_cls, options):
+    limit = 1 if options['fail_fast'] else options['max_errors']
+    errors = []
+    count = 0
+
+    # the items are validated a batch at a time, as an array, which lets the
+    # arrays of records and numbers be validated a column at a time
+    if items_schema is not None:
+        compiled = compile({'items': items_schema}, validator_cls, **options)
+    while True:
+        batch = list(itertools.islice(items, _BATCH))
+        if not batch:
+            break
+        if items_schema is None:
+            count += len(batch)
+            continue
+        valid, batch_errors, _ = next(compiled.validate_many([batch]))
+        for error in batch_errors:
+            if isinstance(error, tuple):
+                code, path, message, suppl = error
+                close = path.index(']')
+                path = u'[%d%s' % (count + int(path[1:close]), path[close:])
+                error = (code, path, message, suppl)
+            # format validators add messages without a path, kept as is
+            errors.append(error)
+        count += len(batch)
+        if limit and len(errors) >= limit:
+            raise ValidationError(errors[:limit])
+
+    # what is left to check is the number of items
+    if 'minItems' in schema and count < schema['minItems']:
+        errors.append(('too-short', None, schema['minItems'], count))
+    if 'maxItems' in schema and count > schema['maxItems']:
+        errors.append(('too-long', None, schema['maxItems'], count))
+
+    if errors:
+        raise ValidationError(errors[:limit] if limit else errors)
+    return count
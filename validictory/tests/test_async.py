@@ -0,0 +1,156 @@
+import gc
+import time
+import threading
+from unittest import TestCase
+
+import validictory
+
+
+class TestValidateAsync(TestCase):
+    schema = {"type": "array", "items": {"type": "object", "properties": {
+        "n": {"type": "integer", "maximum": 10}},
+        "additionalProperties": False}}
+
+    def setUp(self):
+        self.data = [{"n": n % 10} for n in range(100)]
+
+    def test_steps(self):
+        validation = validictory.validate_async(self.data, self.schema,
+                                                yield_every=10)
+        steps = len(list(validation))
+        self.assertTrue(steps >= 10)
+        self.assertTrue(validation.done())
+        self.assertTrue(validation.result is self.data)
+
+    def test_steps_batched(self):
+        # arrays of plain records are checked a slice at a time
+        schema = {"type": "array", "items": {"type": "object", "properties": {
+            "n": {"type": "integer", "maximum": 10}}}}
+        data = [{"n": n % 10} for n in range(20000)]
+        data[12345]["n"] = 11
+        validation = validictory.validate_async(data, schema,
+                                                yield_every=1000)
+        steps = 0
+        try:
+            for _ in validation:
+                steps += 1
+        except validictory.ValidationError as e:
+            self.assertEqual(e.error_list,
+                             [('more-than-maximum', u'[12345].n', 10, 11)])
+        else:
+            self.fail("Expected a ValidationError")
+        self.assertTrue(steps >= 10)
+
+    def test_invalid(self):
+        self.data[42]["n"] = 11
+        validation = validictory.validate_async(self.data, self.schema,
+                                                yield_every=10)
+        try:
+            list(validation)
+        except validictory.ValidationError as e:
+            self.assertEqual(e.error_list,
+                             [('more-than-maximum', u'[42].n', 10, 11)])
+        else:
+            self.fail("Expected a ValidationError")
+
+    def test_cancel(self):
+        validation = validictory.validate_async(self.data, self.schema,
+                                                yield_every=10)
+        next(validation)
+        validation.cancel()
+        self.assertRaises(validictory.ValidationCancelled, list, validation)
+
+    def _wait_for_threads(self, count):
+        for _ in range(100):
+            if threading.active_count() <= count:
+                break
+            time.sleep(0.01)
+        self.assertEqual(threading.active_count(), count)
+
+    def test_close(self):
+        threads = threading.active_count()
+        with validictory.validate_async(self.data, self.schema,
+                                        yield_every=10) as validation:
+            next(validation)
+        self._wait_for_threads(threads)
+        self.assertRaises(validictory.ValidationCancelled, list, validation)
+
+    def test_abandoned(self):
+        threads = threading.active_count()
+        for _ in range(5):
+            validation = validictory.validate_async(self.data, self.schema,
+                                                    yield_every=10)
+            next(validation)
+        del validation
+        gc.collect()
+        self._wait_for_threads(threads)
+
+    def test_without_steps(self):
+        validation = validictory.validate_async(self.data, self.schema,
+                                                yield_every=None)
+        for _ in validation:
+            pass
+        self.assertTrue(validation.result is self.data)
+
+    def test_small(self):
+        # validated right away, without another thread
+        threads = threading.active_count()
+        self.data[42]["n"] = 11
+        validation = validictory.validate_async(self.data, self.schema,
+                                                yield_every=1000)
+        self.assertEqual(threading.active_count(), threads)
+        self.assertTrue(validation.done())
+        self.assertRaises(validictory.ValidationError, list, validation)
+
+    def test_executor(self):
+        class Executor(object):
+            def submit(self, fn):
+                self.fn = fn
+
+        executor = Executor()
+        data = self.data * 10
+        validation = validictory.validate_async(data, self.schema,
+                                                yield_every=None,
+                                                executor=executor)
+        self.assertFalse(validation.done())
+        executor.fn()
+        self.assertEqual(list(validation), [])
+        self.assertTrue(validation.result is data)
+
+    def test_executor_interleaved(self):
+        # more validations than workers don't wait for each other
+        class Executor(object):
+            def __init__(self):
+                self.tasks = []
+                self.ready = threading.Semaphore(0)
+                self.worker = threading.Thread(target=self.work)
+                self.worker.daemon = True
+                self.worker.start()
+
+            def submit(self, fn):
+                self.tasks.append(fn)
+                self.ready.release()
+
+            def work(self):
+                while True:
+                    self.ready.acquire()
+                    self.tasks.pop(0)()
+
+        executor = Executor()
+        validations = [validictory.validate_async(self.data, self.schema,
+                                                  yield_every=10,
+                                                  executor=executor)
+                       for _ in range(3)]
+        pending = list(validations)
+        for _ in range(1000):
+            for validation in list(pending):
+                try:
+                    next(validation)
+                except StopIteration:
+                    pending.remove(validation)
+            if not pending:
+                break
+            time.sleep(0.01)
+        self.assertEqual(pending, [])
+        for validation in validations:
+            self.assertTrue(validation.result is self.data)
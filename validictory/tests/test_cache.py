@@ -0,0 +1,168 @@
+import gc
+import weakref
+from unittest import TestCase
+
+import validictory
+from validictory.cache import SchemaCache, fingerprint
+from validictory.schema import Object, String, Integer, Either
+
+
+class TestSchemaCache(TestCase):
+
+    def test_get_put(self):
+        cache = SchemaCache(maxsize=2)
+        self.assertEqual(cache.get('a'), None)
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_maxsize(self):
+        cache = SchemaCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_maxbytes(self):
+        cache = SchemaCache(maxbytes=100)
+        cache.put('a', 1, 60)
+        cache.put('b', 2, 30)
+        cache.put('c', 3, 30)
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.stats()['bytes'], 60)
+
+    def test_disabled(self):
+        cache = SchemaCache(maxsize=0)
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), None)
+
+    def test_resize_clear(self):
+        cache = SchemaCache()
+        for i in range(10):
+            cache.put(i, i)
+        cache.resize(maxsize=3)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.get(9), 9)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()['hits'], 0)
+
+
+class TestValidateCache(TestCase):
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+    def setUp(self):
+        validictory.schema_cache.clear()
+
+    def test_reused(self):
+        validictory.validate({"name": "a"}, self.schema)
+        validictory.validate({"name": "b"}, self.schema)
+        stats = validictory.schema_cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertTrue(stats['bytes'] > 0)
+
+    def test_options_in_key(self):
+        validictory.validate({"name": "a"}, self.schema)
+        self.assertRaises(ValueError, validictory.validate, {}, self.schema,
+                          required_by_default=True)
+        self.assertEqual(len(validictory.schema_cache), 2)
+
+    def test_equal_schemas(self):
+        validictory.validate({"name": "a"}, self.schema)
+        validictory.validate({"name": "a"}, dict(self.schema))
+        stats = validictory.schema_cache.stats()
+        self.assertEqual((stats['hits'], stats['entries']), (1, 1))
+
+    def test_modified(self):
+        schema = {"properties": {"a": {"type": "string"}}}
+        validictory.validate({"a": "x"}, schema)
+        schema["properties"]["a"]["type"] = "integer"
+        self.assertRaises(ValueError, validictory.validate, {"a": "x"},
+                          schema)
+        validictory.validate({"a": 1}, schema)
+
+    def test_modified_shared(self):
+        # an equal schema doesn't get what the first one compiled to once
+        # that one has been modified
+        first = {"properties": {"a": {"type": "string"}}}
+        second = {"properties": {"a": {"type": "string"}}}
+        validictory.validate({"a": "x"}, first)
+        first["properties"]["a"]["type"] = "integer"
+        validictory.validate({"a": "x"}, second)
+        self.assertRaises(ValueError, validictory.validate, {"a": "x"},
+                          first)
+
+    def test_validator_modified(self):
+        validator = validictory.SchemaValidator()
+        schema = {"properties": {"a": {"type": "string"}}}
+        validator.validate({"a": "x"}, schema)
+        schema["properties"]["a"]["type"] = "integer"
+        self.assertRaises(ValueError, validator.validate, {"a": "x"}, schema)
+        self.assertFalse(validator.is_valid({"a": "x"}, schema))
+
+    def test_validator_schemas(self):
+        validator = validictory.SchemaValidator()
+        strings = {"properties": {"a": {"type": "string"}}}
+        integers = {"properties": {"a": {"type": "integer"}}}
+        for _ in range(2):
+            validator.validate({"a": "x"}, strings)
+            validator.validate({"a": 1}, integers)
+        stats = validator._compiled.stats()
+        self.assertEqual((stats['entries'], stats['hits']), (2, 2))
+
+    def test_errors_not_carried_over(self):
+        self.assertRaises(ValueError, validictory.validate, {"name": 1},
+                          self.schema)
+        validictory.validate({"name": "a"}, self.schema)
+
+
+class TestFingerprint(TestCase):
+
+    def test_contents(self):
+        schema = Object(name=String, id=Either(Integer, String)).pattern(
+            '^x-', String)
+        loaded = {'type': 'object',
+                  'patternProperties': {'^x-': {'type': 'string'}},
+                  'properties': {'id': {'type': [{'type': 'integer'},
+                                                 {'type': 'string'}]},
+                                 'name': {'type': 'string'}}}
+        self.assertEqual(fingerprint(schema), fingerprint(loaded))
+        self.assertEqual(len(fingerprint(schema)), 40)
+
+    def test_differences(self):
+        self.assertNotEqual(fingerprint({'minimum': 1}),
+                            fingerprint({'minimum': 1.0}))
+        self.assertNotEqual(fingerprint({'enum': [1]}),
+                            fingerprint({'enum': [True]}))
+        self.assertNotEqual(fingerprint({'patternProperties': {'a': {}}}),
+                            fingerprint({'patternProperties': {'b': {}}}))
+        self.assertNotEqual(fingerprint({'enum': [1]}),
+                            fingerprint({'enum': ['1']}))
+        self.assertNotEqual(fingerprint({'properties': {1: {}}}),
+                            fingerprint({'properties': {'1': {}}}))
+
+    def test_stable(self):
+        # the digest doesn't depend on the process
+        self.assertEqual(fingerprint({}),
+                         'bf21a9e8fbc5a3846fb05b4fa0859e0917b2202f')
+
+    def test_memoized(self):
+        schema = {'type': 'string'}
+        digest = fingerprint(schema)
+        schema['type'] = 'integer'
+        self.assertEqual(fingerprint(schema), digest)
+        self.assertNotEqual(fingerprint(dict(schema)), digest)
+
+    def test_weakly_held(self):
+        schema = Object(name=String)
+        digest = fingerprint(schema)
+        self.assertEqual(fingerprint(schema), digest)
+        ref = weakref.ref(schema)
+        del schema
+        gc.collect()
+        self.assertTrue(ref() is None)
@@ -0,0 +1,75 @@
+from unittest import TestCase
+import datetime
+
+import validictory
+
+
+class TestCodegen(TestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "maxLength": 10},
+            "age": {"type": "integer", "minimum": 0, "required": False},
+            "tags": {"type": "array", "uniqueItems": True,
+                     "items": {"type": "string", "pattern": "^[a-z]+$"}},
+            "extra": {"type": ["object", "null"],
+                      "additionalProperties": {"type": "number"},
+                      "required": False},
+        }
+    }
+
+    def _errors(self, compiled, data):
+        try:
+            compiled.validate(data)
+        except validictory.ValidationError as e:
+            return e.error_list
+        return []
+
+    def test_source(self):
+        compiled = validictory.compile(self.schema, codegen=True)
+        self.assertTrue(compiled.source.startswith('def validate('))
+        self.assertTrue("'name'" in compiled.source)
+
+    def test_codegen_pass(self):
+        compiled = validictory.compile(self.schema, codegen=True)
+        data = {"name": "foo", "tags": ["a", "b"], "extra": {"x": 1.5}}
+        self.assertEqual(compiled.validate(data), data)
+
+    def test_same_errors(self):
+        nodes = validictory.compile(self.schema)
+        generated = validictory.compile(self.schema, codegen=True)
+        for data in [{"name": 1, "age": -1},
+                     {"name": "a" * 11, "tags": ["a", "a", "B", 3]},
+                     {"name": "", "extra": {"x": "y", "z": None}},
+                     [], None]:
+            errors = self._errors(generated, data)
+            self.assertTrue(errors)
+            self.assertEqual(errors, self._errors(nodes, data))
+
+    def test_defaults(self):
+        schema = {"properties": {"a": {"default": 1}}}
+        compiled = validictory.compile(schema, codegen=True)
+        self.assertEqual(compiled.validate({}), {"a": 1})
+
+    def test_custom_validator(self):
+        schema = {"type": "object", "minProperties": 1,
+                  "properties": {"at": {"type": "datetime"}}}
+        compiled = validictory.compile(
+            schema, validator_cls=validictory.ExtendedSchemaValidator,
+            codegen=True)
+        compiled.validate({"at": datetime.datetime.now()})
+        self.assertRaises(ValueError, compiled.validate, {})
+        self.assertRaises(ValueError, compiled.validate, {"at": "2012"})
+
+    def test_deeply_nested(self):
+        schema = {"type": "string"}
+        for i in range(40):
+            schema = {"type": "array", "items": schema}
+        data = "x"
+        for i in range(40):
+            data = [data]
+
+        compiled = validictory.compile(schema, codegen=True)
+        compiled.validate(data)
+        self.assertEqual(self._errors(compiled, [[[1]]]),
+                         self._errors(validictory.compile(schema), [[[1]]]))
@@ -0,0 +1,178 @@
+import itertools
+from unittest import TestCase
+
+import validictory
+
+
+class TestCompile(TestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "title": "Name"},
+            "age": {"type": "integer", "minimum": 0, "required": False},
+            "tags": {"type": "array", "items": {"type": "string"},
+                     "default": []},
+        }
+    }
+
+    def test_compile_pass(self):
+        compiled = validictory.compile(self.schema)
+        try:
+            for data in [{"name": "a"}, {"name": "b", "age": 3}]:
+                compiled.validate(data)
+        except ValueError as e:
+            self.fail("Unexpected failure: %s" % e)
+
+    def test_compile_fail(self):
+        compiled = validictory.compile(self.schema)
+        for data in [{"name": 1}, {"name": "a", "age": -1},
+                     {"name": "a", "tags": [1]}]:
+            self.assertRaises(ValueError, compiled.validate, data)
+
+    def test_same_errors(self):
+        compiled = validictory.compile(self.schema)
+        data = {"name": "", "age": -4, "tags": ["a", 2]}
+
+        try:
+            validictory.validate(dict(data), self.schema)
+        except validictory.ValidationError as e:
+            expected = e.error_list
+
+        try:
+            compiled.validate(dict(data))
+        except validictory.ValidationError as e:
+            self.assertEqual(e.error_list, expected)
+        else:
+            self.fail("Expected a ValidationError")
+
+    def test_errors_not_carried_over(self):
+        compiled = validictory.compile(self.schema)
+        self.assertRaises(ValueError, compiled.validate, {"name": 1})
+        try:
+            compiled.validate({"name": "a"})
+        except ValueError as e:
+            self.fail("Unexpected failure: %s" % e)
+
+    def test_defaults(self):
+        compiled = validictory.compile(self.schema)
+        self.assertEqual(compiled.validate({"name": "a"}),
+                         {"name": "a", "tags": []})
+
+    def test_required_by_default(self):
+        validictory.compile(self.schema).validate({"age": 3})
+
+        compiled = validictory.compile(self.schema, required_by_default=True)
+        self.assertRaises(ValueError, compiled.validate, {"age": 3})
+
+    def test_schema_error_up_front(self):
+        schema = {"properties": {"name": {"type": "string",
+                                          "optional": True}}}
+        self.assertRaises(validictory.SchemaError, validictory.compile,
+                          schema)
+
+    def test_custom_validator(self):
+        schema = {"type": "object", "minProperties": 2}
+        compiled = validictory.compile(
+            schema, validator_cls=validictory.ExtendedSchemaValidator)
+        compiled.validate({"a": 1, "b": 2})
+        self.assertRaises(ValueError, compiled.validate, {"a": 1})
+
+
+class TestIsValid(TestCase):
+    schema = {"type": "array", "items": {"type": "integer", "maximum": 10}}
+
+    def test_is_valid(self):
+        self.assertTrue(validictory.is_valid([1, 2], self.schema))
+        self.assertFalse(validictory.is_valid([1, "a", 20], self.schema))
+
+    def test_compiled(self):
+        for codegen in (False, True):
+            compiled = validictory.compile(self.schema, codegen=codegen)
+            self.assertTrue(compiled.is_valid([1, 2]))
+            self.assertFalse(compiled.is_valid([20]))
+            self.assertFalse(compiled.is_valid("a"))
+
+    def test_validator(self):
+        validator = validictory.SchemaValidator()
+        self.assertFalse(validator.is_valid([20], self.schema))
+        self.assertTrue(validator.is_valid([2], self.schema))
+        self.assertRaises(ValueError, validator.validate, [20], self.schema)
+
+    def test_schema_error(self):
+        self.assertRaises(validictory.SchemaError, validictory.is_valid,
+                          1, {"type": "float"})
+
+
+class TestValidateMany(TestCase):
+    schema = {"type": "object", "properties": {
+        "n": {"type": "integer", "maximum": 10},
+        "tags": {"type": "array", "default": []}}}
+
+    def test_validate_many(self):
+        records = ({"n": n} for n in [1, 20, "a", 3])
+        results = list(validictory.validate_many(records, self.schema))
+        self.assertEqual([r.valid for r in results],
+                         [True, False, False, True])
+        self.assertEqual(results[0].errors, [])
+        self.assertEqual(results[0].data, {"n": 1, "tags": []})
+        self.assertEqual(results[1].errors,
+                         [('more-than-maximum', u'n', 10, 20)])
+
+    def test_lazy(self):
+        records = ({"n": n % 20} for n in itertools.count())
+        results = validictory.validate_many(records, self.schema)
+        self.assertEqual([r.valid for r in itertools.islice(results, 12)],
+                         [True] * 11 + [False])
+
+    def test_fail_fast(self):
+        results = validictory.validate_many([{"n": 20, "tags": 1}],
+                                            self.schema, fail_fast=True)
+        self.assertEqual(len(next(results).errors), 1)
+
+    def test_coerce_many(self):
+        results = list(validictory.coerce_many([{"n": "3"}, {"n": "x"}],
+                                               self.schema))
+        self.assertEqual(results[0], (True, [], {"n": 3, "tags": []}))
+        self.assertFalse(results[1].valid)
+
+
+class TestValidateParallel(TestCase):
+    schema = TestValidateMany.schema
+
+    def test_validate_parallel(self):
+        records = ({"n": n % 12} for n in range(50))
+        results = list(validictory.validate_parallel(records, self.schema,
+                                                     workers=2, chunksize=4))
+        self.assertEqual([index for index, result in results], list(range(50)))
+        self.assertEqual([index for index, result in results
+                          if not result.valid], [11, 23, 35, 47])
+        self.assertEqual(results[11][1].errors,
+                         [('more-than-maximum', u'n', 10, 11)])
+        self.assertEqual(results[0][1].data, {"n": 0, "tags": []})
+
+    def test_unordered(self):
+        results = validictory.validate_parallel(
+            [{"n": n} for n in range(20)], self.schema, workers=2,
+            chunksize=3, ordered=False)
+        self.assertEqual(sorted(index for index, result in results
+                                if not result.valid), list(range(11, 20)))
+
+    def test_coercer(self):
+        results = list(validictory.validate_parallel(
+            [{"n": "3"}], self.schema, workers=1,
+            validator_cls=validictory.ExtendedSchemaCoercer))
+        self.assertEqual(results, [(0, (True, [], {"n": 3, "tags": []}))])
+
+    def test_schema_error(self):
+        self.assertRaises(validictory.SchemaError,
+                          validictory.validate_parallel, [], {"type": "x"})
+
+    def test_iterable_error(self):
+        def records():
+            for n in range(10):
+                yield {"n": n}
+            raise KeyError("n")
+
+        results = validictory.validate_parallel(records(), self.schema,
+                                                 workers=2, chunksize=4)
+        self.assertRaises(KeyError, list, results)
@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+import validictory
+from validictory.schema import Array, Integer
+
+
+class OldValidator(validictory.SchemaValidator):
+    # a subclass written before fail_fast and max_errors
+    def __init__(self, format_validators=None, required_by_default=False,
+                 blank_by_default=False, ignore_required=False):
+        super(OldValidator, self).__init__(format_validators,
+                                           required_by_default,
+                                           blank_by_default, ignore_required)
+
+
+class TestFailFast(TestCase):
+    schema = {"type": "array", "items": {"type": "integer", "maximum": 10}}
+    data = [1, "a", 20, None, 30]
+
+    def _errors(self, data, schema=None, **kw):
+        try:
+            validictory.validate(data, schema or self.schema, **kw)
+        except validictory.ValidationError as e:
+            return e.error_list
+        self.fail("Expected a ValidationError")
+
+    def test_all_errors(self):
+        self.assertEqual(len(self._errors(self.data)), 4)
+
+    def test_fail_fast(self):
+        self.assertEqual(self._errors(self.data, fail_fast=True),
+                         self._errors(self.data)[:1])
+
+    def test_max_errors(self):
+        self.assertEqual(self._errors(self.data, max_errors=3),
+                         self._errors(self.data)[:3])
+
+    def test_valid(self):
+        validictory.validate([1, 2], self.schema, fail_fast=True)
+
+    def test_old_validator_cls(self):
+        validictory.validate([1, 2], self.schema, validator_cls=OldValidator)
+        self.assertEqual(self._errors(self.data, validator_cls=OldValidator,
+                                      fail_fast=True),
+                         self._errors(self.data)[:1])
+        compiled = validictory.compile(self.schema, OldValidator,
+                                       max_errors=2)
+        self.assertFalse(compiled.is_valid(self.data))
+
+    def test_union(self):
+        # the errors of a failing alternative do not stop the validation
+        schema = {"type": "array", "items": {"type": [
+            {"type": "object", "properties": {"a": {"type": "string"},
+                                              "b": {"type": "string"}}},
+            "integer"]}}
+        validictory.validate([1, {"a": "x", "b": "y"}], schema,
+                             fail_fast=True)
+        errors = self._errors([{"a": 1, "b": 2}, "a"], schema, max_errors=1)
+        self.assertEqual(errors, [('incorrect-type', u'[0]',
+                                   schema['items']['type'],
+                                   {"a": 1, "b": 2})])
+
+    def test_codegen(self):
+        compiled = validictory.compile(self.schema, max_errors=2,
+                                       codegen=True)
+        try:
+            compiled.validate(self.data)
+        except validictory.ValidationError as e:
+            self.assertEqual(e.error_list, self._errors(self.data)[:2])
+        else:
+            self.fail("Expected a ValidationError")
+
+    def test_schema_element(self):
+        schema = Array(items=Integer())
+        try:
+            schema.validate(self.data, fail_fast=True)
+        except validictory.ValidationError as e:
+            self.assertEqual(len(e.error_list), 1)
+        else:
+            self.fail("Expected a ValidationError")
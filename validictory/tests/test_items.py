@@ -1,3 +1,4 @@
+import collections
 from unittest import TestCase
 
 import validictory
@@ -133,3 +134,129 @@ class TestAdditionalItems(TestCase):
         data = [12482, "Yes, more strings", False, 13.37, True,
                 "I'm not allowed"]
         self.assertRaises(ValueError, validictory.validate, data, self.schema4)
+
+
+class TestNumericItems(TestCase):
+    schema = {
+        "type": "object",
+        "properties": {
+            "values": {
+                "type": "array",
+                "items": {"type": "number", "minimum": 0, "maximum": 10,
+                          "exclusiveMaximum": True, "divisibleBy": 2}
+            }
+        }
+    }
+
+    data = {"values": [4, -2, 10, "a", 3, 8.0, None]}
+
+    errors = [
+        ('less-than-minimum', 'values.[1]', 0, -2),
+        ('more-than-maximum', 'values.[2]', 10, 10),
+        ('incorrect-type', 'values.[3]', 'number', 'a'),
+        ('not-divisible-by', 'values.[4]', 2, 3),
+        ('incorrect-type', 'values.[6]', 'number', None),
+    ]
+
+    def assertErrors(self, validate):
+        try:
+            validate(self.data)
+        except validictory.ValidationError as e:
+            self.assertEqual(e.error_list, self.errors)
+        else:
+            self.fail("Expected a ValidationError")
+
+    def test_numeric_items(self):
+        self.assertErrors(lambda data: validictory.validate(data, self.schema))
+        validictory.validate({"values": [0, 2, 8.0]}, self.schema)
+
+    def test_numeric_items_codegen(self):
+        compiled = validictory.compile(self.schema, codegen=True)
+        self.assertErrors(compiled.validate)
+
+    def test_numeric_items_numpy(self):
+        from validictory import numeric
+        if numeric.numpy is None:
+            self.skipTest("numpy not installed")
+        threshold = numeric.NumericItems.numpy_threshold
+        numeric.NumericItems.numpy_threshold = 0
+        try:
+            self.data = {"values": [4, -2, 10, 3, 8.0]}
+            self.errors = [e for e in self.errors
+                           if e[0] != 'incorrect-type']
+            self.errors[-1] = ('not-divisible-by', 'values.[3]', 2, 3)
+            self.assertErrors(
+                lambda data: validictory.validate(data, self.schema))
+        finally:
+            numeric.NumericItems.numpy_threshold = threshold
+
+    def test_numeric_items_max_errors(self):
+        try:
+            validictory.validate(self.data, self.schema, max_errors=2)
+        except validictory.ValidationError as e:
+            self.assertEqual(e.error_list, self.errors[:2])
+        else:
+            self.fail("Expected a ValidationError")
+
+
+class TestRecordItems(TestCase):
+    schema = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer", "minimum": 1, "required": True},
+                "name": {"type": "string", "minLength": 2, "maxLength": 5},
+                "kind": {"enum": ["a", "b"]},
+            }
+        }
+    }
+
+    data = [
+        {"id": 1, "name": "one", "kind": "a"},
+        {"name": "x", "kind": "c"},
+        {"id": 0, "name": "toolong", "kind": None},
+        "record",
+        {"id": 3, "name": 3},
+    ]
+
+    def errors(self):
+        # whatever the order of the properties, the errors follow it
+        errors = {
+            1: [('missing-required', '[1].id', None, None),
+                ('too-short', '[1].name', 2, 1),
+                ('not-in-enumeration', '[1].kind', ["a", "b"], "c")],
+            2: [('less-than-minimum', '[2].id', 1, 0),
+                ('too-long', '[2].name', 5, 7)],
+            3: [('incorrect-type', '[3]', 'object', 'record')],
+            4: [('incorrect-type', '[4].name', 'string', 3)],
+        }
+        order = list(self.schema["items"]["properties"])
+        return [error for index in sorted(errors)
+                for error in sorted(errors[index], key=lambda error:
+                                    order.index(error[1].split('.')[-1])
+                                    if '.' in error[1] else 0)]
+
+    def assertErrors(self, validate, data):
+        try:
+            validate(data)
+        except validictory.ValidationError as e:
+            self.assertEqual(e.error_list, self.errors())
+        else:
+            self.fail("Expected a ValidationError")
+
+    def test_record_items(self):
+        self.assertErrors(
+            lambda data: validictory.validate(data, self.schema), self.data)
+        validictory.validate(self.data[:1], self.schema)
+
+    def test_record_items_codegen(self):
+        compiled = validictory.compile(self.schema, codegen=True)
+        self.assertErrors(compiled.validate, self.data)
+
+    def test_record_items_dict_subclass(self):
+        # validated one by one, with the same errors
+        data = list(self.data)
+        data[0] = collections.OrderedDict(data[0])
+        self.assertErrors(
+            lambda data: validictory.validate(data, self.schema), data)
@@ -0,0 +1,139 @@
+import os
+import sys
+import json
+import tempfile
+from StringIO import StringIO
+from unittest import TestCase
+
+import validictory
+from validictory.ndjson import validate_lines, validate_file
+from validictory.__main__ import main
+
+
+class TestValidateLines(TestCase):
+    schema = {"type": "object", "properties": {
+        "n": {"type": "integer", "maximum": 10}}}
+    text = '{"n": 1}\n\n{"n": "x"}\nnope\n{"n": 11}\n'
+
+    def check(self, results):
+        self.assertEqual([line for line, result in results], [1, 3, 4, 5])
+        self.assertEqual([result.valid for line, result in results],
+                         [True, False, False, False])
+        self.assertEqual(results[1][1].errors,
+                         [('incorrect-type', u'n', u'integer', u'x')])
+        self.assertEqual(results[2][1].errors[0][0], 'invalid-json')
+
+    def test_validate_lines(self):
+        self.check(list(validate_lines(StringIO(self.text), self.schema)))
+
+    def test_workers(self):
+        self.check(list(validate_lines(StringIO(self.text), self.schema,
+                                       workers=2, chunksize=1)))
+
+    def test_schema_error(self):
+        self.assertRaises(validictory.SchemaError, validate_lines, [],
+                          {"type": "x"})
+
+
+class TempFiles(object):
+
+    def setUp(self):
+        self.files = []
+
+    def tearDown(self):
+        for name in self.files:
+            os.remove(name)
+
+    def write(self, text):
+        fd, name = tempfile.mkstemp()
+        os.write(fd, text)
+        os.close(fd)
+        self.files.append(name)
+        return name
+
+
+class TestValidateFile(TempFiles, TestCase):
+    schema = TestValidateLines.schema
+
+    def test_validate_file(self):
+        path = self.write(TestValidateLines.text + '{"n": 2}')
+        for workers in (1, 2):
+            for rangesize in (1, 12, 1 << 20):
+                results = list(validate_file(path, self.schema, workers,
+                                             rangesize))
+                self.assertEqual(
+                    [(line, offset, result.valid)
+                     for line, offset, result in results],
+                    [(1, 0, True), (3, 10, False), (4, 21, False),
+                     (5, 26, False), (6, 36, True)])
+                self.assertEqual(results[3][2].errors,
+                                 [('more-than-maximum', u'n', 10, 11)])
+
+    def test_empty(self):
+        self.assertEqual(list(validate_file(self.write(''), self.schema)),
+                         [])
+
+
+class TestMain(TempFiles, TestCase):
+
+    def test_ndjson(self):
+        schemafile = self.write(json.dumps(TestValidateLines.schema))
+        infile = self.write(TestValidateLines.text)
+        stdout, stderr = StringIO(), StringIO()
+        self.assertRaises(SystemExit, main,
+                          ['validictory', '--ndjson', schemafile, infile],
+                          stdout, stderr)
+        results = [json.loads(line) for line in stdout.getvalue().split('\n')
+                   if line]
+        self.assertEqual([(result['line'], result['offset'])
+                          for result in results], [(3, 10), (4, 21), (5, 26)])
+        self.assertEqual(results[2]['errors'], [
+            {'code': 'more-than-maximum', 'path': 'n', 'message': 10}])
+        summary = json.loads(stderr.getvalue())
+        self.assertEqual((summary['lines'], summary['invalid']), (4, 3))
+        self.assertTrue('lines_per_second' in summary)
+
+    def test_ndjson_valid(self):
+        schemafile = self.write(json.dumps(TestValidateLines.schema))
+        infile = self.write('{"n": 1}\n{"n": 2}\n')
+        stdout, stderr = StringIO(), StringIO()
+        main(['validictory', '--ndjson', schemafile, infile], stdout, stderr)
+        self.assertEqual(stdout.getvalue(), '')
+
+    def test_ndjson_format(self):
+        schemafile = self.write('{"properties": {"d": {"format": "date"}}}')
+        stdin, stdout, stderr = sys.stdin, StringIO(), StringIO()
+        sys.stdin = StringIO('{"d": "2013-01-01"}\n{"d": "nope"}\n')
+        try:
+            self.assertRaises(SystemExit, main,
+                              ['validictory', '--ndjson', schemafile],
+                              stdout, stderr)
+        finally:
+            sys.stdin = stdin
+        report = json.loads(stdout.getvalue())
+        self.assertEqual(report['line'], 2)
+        self.assertEqual([(error['code'], error['path'])
+                          for error in report['errors']], [('format', None)])
+        self.assertTrue("is not in 'date' format" in
+                        report['errors'][0]['message'])
+
+    def test_ndjson_file_format(self):
+        schemafile = self.write('{"properties": {"d": {"format": "date"}}}')
+        infile = self.write('{"d": "2013-01-01"}\n{"d": "nope"}\n')
+        for workers in ('1', '2'):
+            stdout, stderr = StringIO(), StringIO()
+            self.assertRaises(SystemExit, main,
+                              ['validictory', '--ndjson', '--workers',
+                               workers, schemafile, infile], stdout, stderr)
+            report = json.loads(stdout.getvalue())
+            self.assertEqual((report['line'], report['offset']), (2, 20))
+            self.assertEqual([error['code'] for error in report['errors']],
+                             ['format'])
+
+    def test_document(self):
+        schemafile = self.write('{"type": "array", "maxItems": 1}')
+        infile = self.write('[1, 2]')
+        for flags in ([], ['--stream']):
+            self.assertRaises(SystemExit, main,
+                              ['validictory'] + flags + [schemafile, infile])
+        main(['validictory', schemafile, self.write('[1]')])
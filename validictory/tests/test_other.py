@@ -1,3 +1,5 @@
+import sys
+import threading
 from unittest import TestCase
 
 import validictory
@@ -30,3 +32,93 @@ class TestSchemaErrors(TestCase):
     def test_title_fail(self):
         self.assertRaises(ValueError, validictory.validate, self.data,
                           self.invalid_title)
+
+
+class PathValidator(validictory.SchemaValidator):
+    def validate_even(self, x, fieldname, schema, even=None):
+        value = self.get(x, fieldname)
+        if even and isinstance(value, int) and value % 2:
+            self._error('odd', self.current_field, value)
+
+
+class TestErrorPaths(TestCase):
+    schema = {"properties": {"a": {"items": {"properties": {
+        "b": {"type": "integer", "even": True}}}}}}
+
+    def _errors(self, data, **kw):
+        try:
+            validictory.validate(data, self.schema, validator_cls=PathValidator,
+                                 **kw)
+        except validictory.ValidationError as e:
+            return e.error_list
+        self.fail("Expected a ValidationError")
+
+    def test_paths(self):
+        errors = self._errors({"a": [{"b": 2}, {"b": "x"}, {"b": 3}]})
+        self.assertEqual(errors, [
+            ('incorrect-type', u'a.[1].b', 'integer', 'x'),
+            ('odd', u'a.[2].b', ['_data', 'a', '[2]', 'b'], 3)])
+
+    def test_paths_codegen(self):
+        compiled = validictory.compile(self.schema, validator_cls=PathValidator,
+                                       codegen=True)
+        data = {"a": [{"b": 2}, {"b": "x"}, {"b": 3}]}
+        try:
+            compiled.validate(data)
+        except validictory.ValidationError as e:
+            self.assertEqual(e.error_list, self._errors(data))
+        else:
+            self.fail("Expected a ValidationError")
+
+    def test_paths_after_union(self):
+        # an alternative stopped at its first error leaves the path as it was
+        schema = {"properties": {
+            "a": {"type": [{"properties": {"c": {"type": "string"}}},
+                           {"type": "object"}]},
+            "b": {"even": True}}}
+        for max_errors in (None, 1):
+            try:
+                validictory.validate({"a": {"c": 1}, "b": 3}, schema,
+                                     validator_cls=PathValidator,
+                                     max_errors=max_errors)
+            except validictory.ValidationError as e:
+                self.assertEqual(e.error_list,
+                                 [('odd', u'b', ['_data', 'b'], 3)])
+            else:
+                self.fail("Expected a ValidationError")
+
+
+class TestThreads(TestCase):
+
+    def test_shared_validator(self):
+        validator = PathValidator()
+        schema = TestErrorPaths.schema
+        failures = []
+
+        def run(n):
+            data = {"a": [{"b": 2}] * n + [{"b": n}]}
+            for _ in range(200):
+                try:
+                    validator.validate(data, schema)
+                except validictory.ValidationError as e:
+                    errors = e.error_list
+                else:
+                    errors = []
+                expected = [('odd', u'a.[%d].b' % n,
+                             ['_data', 'a', '[%d]' % n, 'b'], n)] if n % 2 else []
+                if errors != expected or validator.is_valid(data, schema) != (
+                        not expected):
+                    failures.append((n, errors))
+
+        interval = sys.getcheckinterval()
+        sys.setcheckinterval(1)
+        try:
+            threads = [threading.Thread(target=run, args=(n,))
+                       for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setcheckinterval(interval)
+        self.assertEqual(failures, [])
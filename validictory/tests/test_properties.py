@@ -117,6 +117,30 @@ class TestPatternProperties(TestCase):
         except ValueError as e:
             self.fail("Unexpected failure: %s" % e)
 
+    def test_patternproperties_overlapping(self):
+        schema = {'patternProperties': {'^a': {'type': 'integer'},
+                                        '.*b$': {'minimum': 2},
+                                        '(x)\\1': {'type': 'string'}},
+                  'additionalProperties': False}
+        validictory.validate({'ab': 3, 'a': 1, 'b': 2, 'xx': 'x'}, schema)
+        for data in [{'ab': 1}, {'ab': 2.5}, {'xx': 1}, {'c': 1}]:
+            self.assertRaises(ValueError, validictory.validate, data, schema)
+
+    def test_patternproperties_conditional(self):
+        schema = {'patternProperties': {'^x': {},
+                                        '^(a)?(?(1)b|c)$': {}},
+                  'additionalProperties': False}
+        validictory.validate({'ab': 's', 'c': 's'}, schema)
+        self.assertRaises(ValueError, validictory.validate, {'ac': 's'},
+                          schema)
+
+    def test_patternproperties_invalid(self):
+        schema = {'patternProperties': {'(a': {'type': 'boolean'}}}
+        self.assertRaises(validictory.SchemaError, validictory.compile,
+                          schema)
+        self.assertRaises(validictory.SchemaError, validictory.validate,
+                          {}, schema)
+
 
 class TestAdditionalProperties(TestCase):
     def test_no_properties(self):
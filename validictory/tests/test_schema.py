@@ -0,0 +1,58 @@
+import copy
+import pickle
+from unittest import TestCase
+
+import validictory
+from validictory import schema
+
+
+class TestSchemaElements(TestCase):
+
+    def setUp(self):
+        self.person = schema.Object(
+            name=schema.String.min_length(2).required,
+            age=schema.Integer.min(0),
+            tags=schema.Array(schema.String).unique_items())
+
+    def test_validate(self):
+        data = {"name": "ab", "age": 3, "tags": ["a"]}
+        self.assertEqual(self.person.validate(data), data)
+        self.assertRaises(validictory.ValidationError, self.person.validate,
+                          {"name": "a"})
+
+    def test_immutable(self):
+        string = schema.String.min_length(2)
+        self.assertEqual(schema.String, {"type": "string"})
+        self.assertEqual(string, {"type": "string", "minLength": 2})
+        self.assertRaises(TypeError, string.__setitem__, "maxLength", 3)
+        self.assertRaises(TypeError, string.update, maxLength=3)
+        self.assertRaises(TypeError, self.person["properties"].pop, "name")
+
+    def test_sharing(self):
+        strict = self.person.additionalProperties(False)
+        self.assertTrue(strict["properties"] is self.person["properties"])
+        merged = self.person.merge(schema.Object(email=schema.String))
+        self.assertEqual(sorted(merged["properties"]),
+                         ["age", "email", "name", "tags"])
+        self.assertEqual(sorted(self.person["properties"]),
+                         ["age", "name", "tags"])
+        patterned = self.person.pattern("^x", schema.Any)
+        self.assertFalse("patternProperties" in self.person)
+        self.assertEqual(patterned["patternProperties"], {"^x": schema.Any})
+
+    def test_hashable(self):
+        same = schema.Object(
+            name=schema.String.min_length(2).required,
+            age=schema.Integer.min(0),
+            tags=schema.Array(schema.String).unique_items())
+        self.assertEqual(hash(same), hash(self.person))
+        self.assertEqual({self.person: 1}[same], 1)
+        self.assertNotEqual(hash(schema.String.min_length(2)),
+                            hash(schema.String.min_length(3)))
+
+    def test_copy(self):
+        for other in (copy.copy(self.person), copy.deepcopy(self.person),
+                      pickle.loads(pickle.dumps(self.person, 2))):
+            self.assertEqual(other, self.person)
+            self.assertEqual(type(other), type(self.person))
+            self.assertRaises(TypeError, other.__setitem__, "x", 1)
@@ -0,0 +1,86 @@
+import json
+from StringIO import StringIO
+from unittest import TestCase
+
+import validictory
+from validictory import stream
+
+
+class TestIterArray(TestCase):
+    text = '[1, -2.5e3 ,"a\\"b", [], {"x": [1, 2]}, true, null, 10]'
+
+    def test_items(self):
+        expected = json.loads(self.text)
+        for chunksize in (1, 2, 3, 5, 65536):
+            items = stream.iter_array(StringIO(self.text), chunksize)
+            self.assertEqual(list(items), expected)
+
+    def test_empty(self):
+        self.assertEqual(list(stream.iter_array(StringIO(' [ ] '), 1)), [])
+
+    def test_not_array(self):
+        self.assertRaises(ValueError, stream.iter_array, StringIO('{}'))
+
+    def test_invalid(self):
+        for text in ('[1 2]', '[1,', '[1] 2', '[1.]', '[tru]'):
+            items = stream.iter_array(StringIO(text), 1)
+            self.assertRaises(ValueError, list, items)
+
+
+class TestValidateStream(TestCase):
+    schema = {"type": "array", "minItems": 1, "maxItems": 3,
+              "items": {"type": "object", "properties": {
+                  "n": {"type": "integer", "maximum": 10}}}}
+
+    def validate(self, data, schema=None, **kwargs):
+        return validictory.validate_stream(StringIO(json.dumps(data)),
+                                           schema or self.schema,
+                                           chunksize=4, **kwargs)
+
+    def test_valid(self):
+        self.assertEqual(self.validate([{"n": 1}, {"n": 2}]), 2)
+
+    def test_invalid(self):
+        try:
+            self.validate([{"n": 1}, {"n": 11}, {"n": "x"}, {"n": 12}])
+        except validictory.ValidationError as e:
+            self.assertEqual(e.error_list, [
+                ('more-than-maximum', u'[1].n', 10, 11),
+                ('incorrect-type', u'[2].n', u'integer', u'x'),
+                ('more-than-maximum', u'[3].n', 10, 12),
+                ('too-long', None, 3, 4)])
+        else:
+            self.fail("Expected a ValidationError")
+
+    def test_format(self):
+        schema = {"items": {"properties": {"d": {"format": "date"}}}}
+        try:
+            self.validate([{"d": "2013-01-01"}] * 5 + [{"d": "nope"}],
+                          schema)
+        except validictory.ValidationError as e:
+            self.assertEqual(len(e.error_list), 1)
+            self.assertTrue(e.error_list[0].endswith(
+                "of field 'd' is not in 'date' format"))
+        else:
+            self.fail("Expected a ValidationError")
+
+    def test_max_errors(self):
+        try:
+            self.validate([{"n": 11}] * 5, max_errors=2)
+        except validictory.ValidationError as e:
+            self.assertEqual([path for _, path, _, _ in e.error_list],
+                             [u'[0].n', u'[1].n'])
+        else:
+            self.fail("Expected a ValidationError")
+
+    def test_too_short(self):
+        self.assertRaises(validictory.ValidationError, self.validate, [])
+
+    def test_not_streamed(self):
+        # other documents and schemas are validated whole
+        self.assertEqual(self.validate({"n": 1}, {"type": "object"}), None)
+        self.assertEqual(self.validate([1, 2], {"uniqueItems": True}), None)
+        self.assertRaises(validictory.ValidationError, self.validate,
+                          {"n": 1})
+        self.assertRaises(validictory.ValidationError, self.validate,
+                          [1, 1], {"uniqueItems": True})
@@ -146,3 +146,32 @@ class TestCustomType(TestCase):
         for x in invalids:
             self.assertRaises(ValueError, validator.validate, x,
                               {"type": typename})
+
+
+class TestUnionType(TestCase):
+    def test_nullable(self):
+        schema = validictory.String().nullable
+        for x in ["a", None]:
+            validictory.validate(x, schema)
+        for x in ["", 1, True]:
+            self.assertRaises(ValueError, validictory.validate, x, schema)
+        validictory.validate("", schema, blank_by_default=True)
+
+    def test_mixed(self):
+        schema = {"type": ["null", {"type": "object",
+                                    "properties": {"a": {"type": "integer"}}},
+                           ["boolean"]]}
+        for x in [None, {"a": 1}, {}, False]:
+            validictory.validate(x, schema)
+        for x in [{"a": "b"}, 1, "a"]:
+            self.assertRaises(ValueError, validictory.validate, x, schema)
+
+    def test_custom(self):
+        validator = DateValidator()
+        validator.validate(datetime.date.today(), {"type": ["null", "date"]})
+        self.assertRaises(ValueError, validator.validate, 2010,
+                          {"type": [{"type": "date"}, "null"]})
+
+    def test_unsupported(self):
+        self.assertRaises(validictory.SchemaError, validictory.compile,
+                          {"type": ["string", "date"]})
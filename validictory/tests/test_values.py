@@ -25,6 +25,26 @@ class TestEnum(TestCase):
 
         self.assertRaises(ValueError, validictory.validate, data, self.schema)
 
+    def test_enum_equality(self):
+        # options compare as they would in the list
+        for data in (1, 1.0, 123.0, [u"???"]):
+            validictory.validate(data, self.schema)
+            validictory.compile(self.schema2, codegen=True).validate(data)
+        for data in (False, 0, ["???", 1], {"???": 1}):
+            self.assertRaises(ValueError, validictory.validate, data,
+                              self.schema)
+
+    def test_enum_items(self):
+        schema = {"items": {"enum": self.schema["enum"]}}
+        try:
+            validictory.validate(["test", 2, ["???"], {}], schema)
+        except validictory.ValidationError as e:
+            self.assertEqual([error[1] for error in e.error_list],
+                             [u'[1]', u'[3]'])
+            self.assertTrue(e.error_list[0][2] is self.schema["enum"])
+        else:
+            self.fail("Expected a ValidationError")
+
 
 class TestPattern(TestCase):
 
@@ -53,6 +73,11 @@ class TestPattern(TestCase):
 
         self.assertRaises(ValueError, validictory.validate, data, self.schema)
 
+    def test_pattern_invalid(self):
+        # reported for the schema, even if there is no string to match
+        self.assertRaises(validictory.SchemaError, validictory.validate,
+                          123, {"pattern": "^[a-z"})
+
 
 def validate_format_contains_spaces(validator, fieldname, value,
                                     format_option):
@@ -117,6 +142,19 @@ class TestFormat(TestCase):
         self.assertRaises(ValueError, validictory.validate, data,
                           self.schema_datetime)
 
+    def test_format_datetime_leap_years(self):
+        for data in ("2012-02-29T00:00:00Z", "2000-2-29t23:59:59z"):
+            validictory.validate(data, self.schema_datetime)
+        for data in ("1900-02-29T00:00:00Z", "2012-04-31T00:00:00Z",
+                     "0000-01-01T00:00:00Z", "2012-01-01T00:00:60Z"):
+            self.assertRaises(ValueError, validictory.validate, data,
+                              self.schema_datetime)
+
+    def test_format_datetime_not_string_fail(self):
+        for data in (20110113, ["2011-01-13T10:56:53Z"]):
+            self.assertRaises(ValueError, validictory.validate, data,
+                              self.schema_datetime)
+
     def test_format_datetime_notutc_fail(self):
         data = "2011-01-13T10:56:53+01: 00"
 
@@ -163,6 +201,68 @@ class TestFormat(TestCase):
             self.assertRaises(ValueError, validictory.validate, ip,
                               self.schema_ip)
 
+    def test_format_ip_not_decimal_fail(self):
+        for ip in ["010.0.0.1", "0x1.0.0.1", "1.2.3", " 1.2.3.4"]:
+            self.assertRaises(ValueError, validictory.validate, ip,
+                              self.schema_ip)
+
+    def test_format_extended(self):
+        valids = {
+            "email": ["a@example.com", "first.last+tag@sub.example.org"],
+            "uri": ["http://example.com/a?b=c#d", "urn:isbn:0451450523",
+                    "http://[::1]:80/%20"],
+            "hostname": ["example.com", "a-b.example.com.", "localhost"],
+            "ipv6": ["::", "::1", "2001:db8::8a2e:370:7334",
+                     "1:2:3:4:5:6:7:8", "::ffff:192.0.2.1"],
+            "uuid": ["123e4567-e89b-12d3-a456-426614174000"],
+            "color": ["red", "Navy", "#fff", "#A0b1C2", "rgb(1, 2, 3)",
+                      "rgb(10%,20%,30.5%)"],
+        }
+        invalids = {
+            "email": ["a", "@example.com", "a@", "a..b@example.com",
+                      "a b@example.com", "a@-example.com"],
+            "uri": ["example.com", "/a/b", "http://a b", "http://a/%2"],
+            "hostname": ["-a.com", "a-.com", "a..b", "a_b.com",
+                         "a" * 64 + ".com"],
+            "ipv6": ["1::2::3", "12345::", "1:2:3:4:5:6:7", "1.2.3.4",
+                     "1:2:3:4:5:6:7:8:9", "1.2.3.4::"],
+            "uuid": ["123e4567e89b12d3a456426614174000",
+                     "123e4567-e89b-12d3-a456-42661417400g"],
+            "color": ["redd", "#ff", "#ffff", "rgb(1,2)", "rgb(1%,2,3)"],
+        }
+        for format_option, values in valids.items():
+            for value in values:
+                validictory.validate(value, {"format": format_option})
+        for format_option, values in invalids.items():
+            for value in values + [12]:
+                self.assertRaises(ValueError, validictory.validate, value,
+                                  {"format": format_option})
+
+    def test_format_memo(self):
+        calls = []
+
+        def validate_format_even(validator, fieldname, value, format_option):
+            calls.append(value)
+            if len(value) % 2:
+                validator.error_list.append("odd")
+
+        validator = validictory.SchemaValidator()
+        validator.register_format_validator("even", validate_format_even)
+        memo = validator.memoize_formats(maxsize=1)
+        schema = {"items": {"format": "even"}}
+
+        self.assertRaises(ValueError, validator.validate,
+                          ["ab", "ab", "abc", "abc", "cd", "ab"], schema)
+        self.assertEqual(calls, ["ab", "abc", "abc", "cd", "ab"])
+        self.assertEqual(memo.stats()["hits"], 1)
+
+        # impure formats aren't memoized
+        del calls[:]
+        validator.register_format_validator("even", validate_format_even,
+                                            memoize=False)
+        validator.validate(["ab", "ab"], schema)
+        self.assertEqual(calls, ["ab", "ab"])
+
     def test_format_required_false(self):
         schema = {
             'type': 'object',
@@ -293,6 +393,29 @@ class TestUniqueItems(TestCase):
 
         self.assertRaises(ValueError, validictory.validate, data, self.schema)
 
+    def test_uniqueitems_fail_indexes(self):
+        data = [{'one': [1, 2]}, [1], {'one': [1.0, 2]}, (1,), [True]]
+
+        try:
+            validictory.validate(data, self.schema)
+        except validictory.ValidationError as e:
+            self.assertEqual(e.error_list, [
+                ('not-unique', None, {'one': [1.0, 2]}, (0, 2)),
+                ('not-unique', None, [True], (1, 4))])
+        else:
+            self.fail("Expected a ValidationError")
+
+    def test_uniqueitems_unhashable(self):
+        data = [set([1]), (1, [2]), set([1]), (1, [2])]
+
+        try:
+            validictory.validate(data, self.schema)
+        except validictory.ValidationError as e:
+            self.assertEqual([error[3] for error in e.error_list],
+                             [(0, 2), (1, 3)])
+        else:
+            self.fail("Expected a ValidationError")
+
     def test_uniqueitems_fail_null(self):
         data = [None, None]
 
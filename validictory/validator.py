@@ -1,19 +1,31 @@
 import re
 import sys
 import copy
-import socket
-from functools import wraps
 
-from datetime import datetime
-from collections import Mapping, Container
+from collections import Mapping, Container, Hashable, namedtuple
+
+from cache import SchemaCache, fingerprint, _forget
+from numeric import NumericItems
+from columns import Column, RecordColumns
+from enumeration import Enumeration
+from formats import (validate_format_email, validate_format_uri,
+                     validate_format_hostname, validate_format_ipv6,
+                     validate_format_uuid, validate_format_color, _is_ipv4)
 
 if sys.version_info[0] == 3:
     _str_type = str
     _int_types = (int,)
+
+    def _reraise(exc_info):
+        raise exc_info[1].with_traceback(exc_info[2])
 else:
     _str_type = basestring
     _int_types = (int, long)
 
+    # the python 2 syntax can't even be compiled by python 3
+    exec('def _reraise(exc_info):\n'
+         '    raise exc_info[0], exc_info[1], exc_info[2]\n')
+
 
 class SchemaError(ValueError):
     """
@@ -33,21 +45,62 @@ class ValidationError(ValueError):
         self.error_list = error_list
 
 
-def _generate_datetime_validator(format_option, dateformat_string):
+#: The outcome of validating one of many documents, see
+#: :meth:`CompiledSchema.validate_many`.
+ValidationResult = namedtuple('ValidationResult', 'valid errors data')
+
+
+class _Stop(Exception):
+    '''
+    Raised to stop validating once enough errors have been found.
+    '''
+
+
+# recorded instead of the errors when only the validity of the data matters
+_INVALID = ('invalid', None, None, None)
+
+# a value not worked out yet
+_UNSET = object()
+
+
+# what datetime.strptime accepts for %Y-%m-%d and %H:%M:%S (up to the
+# ranges of the days and seconds), ignoring case as it does
+_DATE_PATTERN = (r'(?P<year>\d\d\d\d)-(?P<month>1[0-2]|0[1-9]|[1-9])-'
+                 r'(?P<day>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])')
+_TIME_PATTERN = r'(?:2[0-3]|[0-1]\d|\d):(?:[0-5]\d|\d):(?:[0-5]\d|\d)'
+
+_DAYS_IN_MONTH = (None, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _valid_date(match):
+    if 'year' not in match.re.groupindex:
+        return True
+    year = int(match.group('year'))
+    if not year:
+        return False
+    month = int(match.group('month'))
+    day = int(match.group('day'))
+    if month == 2 and day == 29:
+        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return day <= _DAYS_IN_MONTH[month]
+
+
+def _generate_datetime_validator(format_option, pattern):
+    regex = re.compile(pattern + r'\Z', re.IGNORECASE)
+
     def validate_format_datetime(validator, fieldname, value, format_option):
-        try:
-            datetime.strptime(value, dateformat_string)
-        except ValueError:
+        match = regex.match(value) if isinstance(value, _str_type) else None
+        if match is None or not _valid_date(match):
             validator.error_list.append(
                 "Value %(value)r of field '%(fieldname)s' is not in "
                 "'%(format_option)s' format" % locals())
 
     return validate_format_datetime
 
-validate_format_date_time = _generate_datetime_validator('date-time',
-                                                         '%Y-%m-%dT%H:%M:%SZ')
-validate_format_date = _generate_datetime_validator('date', '%Y-%m-%d')
-validate_format_time = _generate_datetime_validator('time', '%H:%M:%S')
+validate_format_date_time = _generate_datetime_validator(
+    'date-time', _DATE_PATTERN + 'T' + _TIME_PATTERN + 'Z')
+validate_format_date = _generate_datetime_validator('date', _DATE_PATTERN)
+validate_format_time = _generate_datetime_validator('time', _TIME_PATTERN)
 
 
 def validate_format_utc_millisec(validator, fieldname, value, format_option):
@@ -61,14 +114,8 @@ def validate_format_utc_millisec(validator, fieldname, value, format_option):
 
 
 def validate_format_ip_address(validator, fieldname, value, format_option):
-    try:
-        socket.inet_aton(value)
-        # Make sure we expect "X.X.X.X" as socket.inet_aton() converts "1"
-        # to "0.0.0.1"
-        ip = len(value.split('.')) == 4
-    except:
-        ip = False
-    if not ip:
+    # "X.X.X.X" with decimal numbers up to 255
+    if not isinstance(value, _str_type) or not _is_ipv4(value):
         validator.error_list.append("Value %(value)r of field '%(fieldname)s' is "
                               "not a ip-address" % locals())
 
@@ -79,41 +126,57 @@ DEFAULT_FORMAT_VALIDATORS = {
     'time': validate_format_time,
     'utc-millisec': validate_format_utc_millisec,
     'ip-address': validate_format_ip_address,
+    'email': validate_format_email,
+    'uri': validate_format_uri,
+    'hostname': validate_format_hostname,
+    'ipv6': validate_format_ipv6,
+    'uuid': validate_format_uuid,
+    'color': validate_format_color,
 }
 
 
-class MetaSchemaValidator(type):
-    ''' A metaclass that helps keeping track of the fields path
-    '''
-
-    def __new__(cls, name, bases, dct):
-        for method_name, method in list(dct.items()):
-            if method_name.startswith('validate_') and not method_name.startswith('validate_type_') and callable(method):
+# tell the frozen lists, dicts and tuples apart from each other and from
+# the values of an array
+_LIST = object()
+_DICT = object()
+_TUPLE = object()
 
-                def make_wrapper(method_name, method):
-                    @wraps(method)
-                    def wrapper(self, x, fieldname, schema, *a, **kw):
-                        name = fieldname if not isinstance(fieldname, int) else '[%d]' % fieldname
 
-                        if self.current_object and self.current_object[-1] is x:
-                            pop_at_end = False
-                            self.current_field[-1] = name
-                        else:
-                            pop_at_end = True
-                            self.current_object.append(x)
-                            self.current_field.append(name)
-
-                        res = method(self, x, fieldname, schema, *a, **kw)
+def _frozen(value):
+    '''
+    Returns a hashable copy of a value, equal to the copy of another value
+    if the values are equal.
+    '''
+    if isinstance(value, dict):
+        return (_DICT, frozenset((key, _frozen(item))
+                                 for key, item in value.items()))
+    if isinstance(value, list):
+        return (_LIST, tuple(_frozen(item) for item in value))
+    if isinstance(value, tuple):
+        return (_TUPLE, tuple(_frozen(item) for item in value))
+    return value
 
-                        if pop_at_end:
-                            self.current_field.pop()
-                            self.current_object.pop()
-                        return res
-                    return wrapper
 
-                dct[method_name] = make_wrapper(method_name, method)
+def _duplicates(values):
+    '''
+    Yields the ``(first, index, value)`` of the values equal to an earlier
+    value, ``first`` being the index of that earlier value.
+    '''
+    seen = {}
+    # the values that can't be hashed, even frozen
+    unhashables = []
 
-        return super(MetaSchemaValidator, cls).__new__(cls, name, bases, dct)
+    for index, value in enumerate(values):
+        try:
+            key = _frozen(value)
+            first = seen.setdefault(key, index)
+        except TypeError:
+            first = next((first for first, other in unhashables
+                          if other == value), index)
+            if first == index:
+                unhashables.append((index, value))
+        if first != index:
+            yield first, index, value
 
 
 class SchemaValidator(object):
@@ -128,17 +191,64 @@ class SchemaValidator(object):
         schema attribute True by default.
     :param ignore_required: defaults to False, set to True to skip the ``required``
         tests, to allow for partial validation of an object.
-    '''
+    :param fail_fast: defaults to False, set to True to stop validating at the
+        first error.
+    :param max_errors: optional number of errors after which to stop
+        validating.
 
-    __metaclass__ = MetaSchemaValidator
+    The state of each validation is kept apart from the validator, so one
+    validator can be shared by many threads.
+    '''
 
     @property
     def current_field_name(self):
         current = u'.'.join(self.current_field[1:])  # we remove the first _data.
         return current if current else None
 
+    @property
+    def current_field(self):
+        '''
+        The path of the field being validated, starting with ``'_data'``.
+        '''
+        return self._current_path()[0]
+
+    @property
+    def current_object(self):
+        '''
+        The objects containing each field of :attr:`current_field`.
+        '''
+        return self._current_path()[1]
+
+    def _current_path(self):
+        # Nothing but a link to the schema node being visited is kept while
+        # validating, the path is only worked out from these links when
+        # needed.
+        visits = []
+        link = self._path
+        while link is not None:
+            link, x, fieldname = link
+            visits.append((x, fieldname))
+
+        # generated code gives the path it is at when calling back into the
+        # schema nodes or the validate_* methods
+        fields, x = self._path_prefix or ((), None)
+        fields = list(fields)
+        objects = [None] * len(fields)
+        if objects:
+            objects[-1] = x
+
+        for x, fieldname in reversed(visits):
+            name = fieldname if not isinstance(fieldname, int) else '[%d]' % fieldname
+            if objects and objects[-1] is x:
+                fields[-1] = name
+            else:
+                objects.append(x)
+                fields.append(name)
+        return fields, objects
+
     def __init__(self, format_validators=None, required_by_default=False,
-                 blank_by_default=False, ignore_required=False):
+                 blank_by_default=False, ignore_required=False,
+                 fail_fast=False, max_errors=None):
         if format_validators is None:
             format_validators = DEFAULT_FORMAT_VALIDATORS.copy()
 
@@ -146,11 +256,30 @@ class SchemaValidator(object):
         self.required_by_default = required_by_default
         self.blank_by_default = blank_by_default
         self.ignore_required = ignore_required
+        self.fail_fast = fail_fast
+        self.max_errors = max_errors
 
         self.error_list = []
         self.error_stack = []
-        self.current_field = []
-        self.current_object = []
+        # the (parent, x, fieldname) link of the schema node being visited
+        self._path = None
+        self._path_prefix = None
+        self._quiet = False
+        # the number of errors at which to stop, and the depth of the error
+        # stack it applies to
+        self._limit = None
+        self._limit_depth = 0
+        self._nodes = {}
+        self._patterns = {}
+        self._matchers = {}
+        self._enums = {}
+        # the schemas compiled for validate, keyed like schema_cache
+        self._compiled = SchemaCache(maxsize=32)
+        # called before visiting each schema, see validate_async
+        self._checkpoint = None
+        # the strings found valid for each format, see memoize_formats
+        self.format_memo = None
+        self._unmemoized = set()
 
     def get(self, x, field, default=None):
         try:
@@ -169,8 +298,70 @@ class SchemaValidator(object):
         self.error_list = self.error_stack.pop()
         return last_error
 
-    def register_format_validator(self, format_name, format_validator_fun):
+    def _begin_attempt(self):
+        '''
+        Starts validating an alternative (of a union of types), of which only
+        matters whether it has errors: when the validation is to stop early,
+        it stops at its first error.
+        '''
+        state = (self._limit, self._limit_depth)
+        self.push_error_stack()
+        if self._limit is not None:
+            self._limit, self._limit_depth = 1, len(self.error_stack)
+        return state
+
+    def _end_attempt(self, state):
+        '''
+        Ends the validation of an alternative, returns its errors.
+        '''
+        self._limit, self._limit_depth = state
+        return self.pop_error_stack()
+
+    def _check_errors(self):
+        if (self._limit is not None and
+                len(self.error_stack) == self._limit_depth and
+                len(self.error_list) >= self._limit):
+            raise _Stop()
+
+    def register_format_validator(self, format_name, format_validator_fun,
+                                  memoize=True):
+        '''
+        Registers the function validating a format. With ``memoize=False``
+        its results aren't kept by :meth:`memoize_formats`, for functions
+        that don't tell the same of the same value every time.
+        '''
         self._format_validators[format_name] = format_validator_fun
+        if memoize:
+            self._unmemoized.discard(format_name)
+        else:
+            self._unmemoized.add(format_name)
+        if self.format_memo is not None:
+            self.format_memo.clear()
+
+    def memoize_formats(self, maxsize=4096):
+        '''
+        Keeps the ``maxsize`` strings last found valid for their formats, so
+        that the format functions don't run again for the same strings.
+        Returns the :class:`~validictory.cache.SchemaCache` keeping them, with
+        its hit rate in ``stats()``. ``maxsize=0`` stops memoizing.
+        '''
+        self.format_memo = SchemaCache(maxsize) if maxsize > 0 else None
+        return self.format_memo
+
+    def _format(self, format_validator, fieldname, value, format_option):
+        memo = self.format_memo
+        if (memo is None or not isinstance(value, _str_type) or
+                format_option in self._unmemoized):
+            format_validator(self, fieldname, value, format_option)
+            return
+
+        key = (format_option, value)
+        if memo.get(key):
+            return
+        count = len(self.error_list)
+        format_validator(self, fieldname, value, format_option)
+        if len(self.error_list) == count:
+            memo.put(key, True)
 
     def validate_type_string(self, val):
         return isinstance(val, _str_type)
@@ -197,7 +388,11 @@ class SchemaValidator(object):
         return True
 
     def _error(self, code, message=None, suppl=None):
-        self.error_list.append((code, self.current_field_name, message, suppl))
+        if self._quiet:
+            self.error_list.append(_INVALID)
+        else:
+            self.error_list.append((code, self.current_field_name, message, suppl))
+        self._check_errors()
 
     def validate_type(self, x, fieldname, schema, fieldtype=None):
         '''
@@ -218,9 +413,12 @@ class SchemaValidator(object):
                 # Match if type matches any one of the types in the list
                 datavalid = False
                 for eachtype in fieldtype:
-                    self.push_error_stack()
-                    self.validate_type(x, fieldname, eachtype, eachtype)
-                    errs = self.pop_error_stack()
+                    state = self._begin_attempt()
+                    try:
+                        self.validate_type(x, fieldname, eachtype, eachtype)
+                    except _Stop:
+                        pass
+                    errs = self._end_attempt(state)
                     if not errs:
                         datavalid = True
                         break
@@ -233,6 +431,7 @@ class SchemaValidator(object):
                 errs = self.pop_error_stack()
                 if errs:
                     self.error_list += errs
+                    self._check_errors()
             else:
                 try:
                     type_checker = getattr(self, 'validate_type_%s' % fieldtype)
@@ -284,16 +483,41 @@ class SchemaValidator(object):
                         for itemIndex in range(len(items)):
                             self.__validate(itemIndex, value, items[itemIndex])
                 elif isinstance(items, dict):
-                    for i, eachItem in enumerate(value):
-                        self.push_error_stack()
-                        self.__validate(i, value, items)
-                        errs = self.pop_error_stack()
-                        if errs:
-                            self.error_list += errs
+                    batch = _node(self, items).batch(self)
+                    if batch is None or self._checkpoint is None:
+                        self._validate_slice(value, items, batch, 0,
+                                             len(value))
+                        return
+                    # checked a slice at a time, so that a validation going
+                    # a step at a time can pause in between
+                    for start in range(0, len(value), _CHECKPOINT_SLICE):
+                        stop = min(start + _CHECKPOINT_SLICE, len(value))
+                        self._validate_slice(value, items, batch, start,
+                                             stop)
+                        self._checkpoint(stop - start)
                 else:
                     raise SchemaError("Properties definition of field '%s' is "
                                       "not a list or an object" % fieldname)
 
+    def _validate_slice(self, value, items, batch, start, stop):
+        '''
+        Validates the items of ``value`` from ``start`` to ``stop`` against
+        the ``items`` schema, all at once when ``batch`` can.
+        '''
+        if batch is not None:
+            whole = start == 0 and stop == len(value)
+            failures = batch.failures(value if whole else value[start:stop])
+            if failures is not None:
+                _report_items(self, failures, start)
+                return
+        for i in range(start, stop):
+            self.push_error_stack()
+            self.__validate(i, value, items)
+            errs = self.pop_error_stack()
+            if errs:
+                self.error_list += errs
+                self._check_errors()
+
     def validate_required(self, x, fieldname, schema, required):
         '''
         Validates that the given field is present if required is True
@@ -321,10 +545,14 @@ class SchemaValidator(object):
 
         value_obj = self.get(x, fieldname, {})
 
-        for pattern, schema in patternproperties.items():
-            for key, value in value_obj.items():
-                if re.match(pattern, key):
-                    self.__validate(key, value_obj, schema)
+        schemas = patternproperties.values()
+        if not schemas:
+            return
+
+        buckets = self._matcher(patternproperties).buckets(value_obj.items())
+        for schema, keys in zip(schemas, buckets):
+            for key in keys:
+                self.__validate(key, value_obj, schema)
 
     def validate_additionalItems(self, x, fieldname, schema,
                                  additionalItems=False):
@@ -366,7 +594,7 @@ class SchemaValidator(object):
 
         if isinstance(additionalProperties, (dict, bool)):
             properties = schema.get("properties", [])
-            patternProperties = schema.get('patternProperties', [])
+            matcher = self._matcher(schema.get('patternProperties', []))
             if properties is None:
                 properties = {}
             if value is None:
@@ -376,12 +604,7 @@ class SchemaValidator(object):
                     continue
 
                 # Check if the property matches a patternProperty
-                matched = False
-                for pattern in patternProperties:
-                    if re.match(pattern, eachProperty):
-                        matched = True
-                        break
-                if matched:
+                if matcher.classify(eachProperty):
                     continue
 
                 # If additionalProperties is the boolean value False
@@ -391,7 +614,7 @@ class SchemaValidator(object):
                 else:
                     # If it's an object, then we try to validate the value
                     # on the schema.
-                    self.validate(value, additionalProperties)
+                    self.__validate(eachProperty, value, additionalProperties)
         else:
             raise SchemaError("additionalProperties schema definition for "
                               "field '%s' is not an object" % fieldname)
@@ -480,7 +703,8 @@ class SchemaValidator(object):
         format_validator = self._format_validators.get(format_option, None)
 
         if format_validator and value:
-            format_validator(self, fieldname, value, format_option)
+            self._format(format_validator, fieldname, value, format_option)
+            self._check_errors()
 
         # TODO: warn about unsupported format ?
 
@@ -491,7 +715,7 @@ class SchemaValidator(object):
         '''
         value = self.get(x, fieldname)
         if isinstance(value, _str_type):
-            if not re.match(pattern, value):
+            if not self._regex(pattern).match(value):
                 self._error('pattern-mismatch', pattern, fieldname)
 
     def validate_uniqueItems(self, x, fieldname, schema, uniqueItems=False):
@@ -510,19 +734,8 @@ class SchemaValidator(object):
         if not isinstance(values, (list, tuple)):
             return
 
-        hashables = set()
-        unhashables = []
-
-        for value in values:
-            if isinstance(value, (list, dict)):
-                container, add = unhashables, unhashables.append
-            else:
-                container, add = hashables, hashables.add
-
-            if value in container:
-                self._error('not-unique', value)
-            else:
-                add(value)
+        for first, index, value in _duplicates(values):
+            self._error('not-unique', value, (first, index))
 
     def validate_enum(self, x, fieldname, schema, options=None):
         '''
@@ -534,7 +747,7 @@ class SchemaValidator(object):
             if not isinstance(options, Container):
                 raise SchemaError("Enumeration %r for field '%s' must be a "
                                   "container", (options, fieldname))
-            if value not in options:
+            if value not in self._enumeration(options):
                 self._error('not-in-enumeration', options, value)
 
     def validate_title(self, x, fieldname, schema, title=None):
@@ -578,15 +791,75 @@ class SchemaValidator(object):
             return
         self._error('disallowed-type', disallow, self.get(x, fieldname))
 
+    def compile(self, schema, codegen=False):
+        '''
+        Compiles the provided json-schema against the configuration of this
+        validator and returns a :class:`CompiledSchema`.
+
+        With ``codegen=True`` python source specialized for the schema is
+        generated as well, see :class:`~validictory.codegen.GeneratedSchema`.
+        '''
+        if codegen:
+            from validictory.codegen import GeneratedSchema
+            return GeneratedSchema(self, schema)
+        return CompiledSchema(self, schema)
+
     def validate(self, data, schema):
         '''
         Validates a piece of json data against the provided json-schema.
         Returns the validated data.
+
+        The schema is compiled on first use, the last schemas used being
+        kept for as long as they aren't modified.
         '''
-        result = self._validate(data, schema)
-        if self.error_list:
-            raise ValidationError(self.error_list)
-        return result
+        compiled = self._compiled_for(schema)
+        # the state of the validation is kept on a copy, so that the
+        # validator can be used from several threads at once
+        return compiled._apply(copy.copy(self), data)
+
+    def is_valid(self, data, schema):
+        '''
+        Tells whether a piece of json data is valid against the provided
+        json-schema, see :meth:`CompiledSchema.is_valid`.
+        '''
+        return self._compiled_for(schema)._check(copy.copy(self), data)
+
+    def _compiled_for(self, schema):
+        '''
+        Returns the compiled schema kept for :meth:`validate`, compiling the
+        schema again if it isn't kept or has been modified since.
+        '''
+        return _lookup(self._compiled, schema, (), self.compile)
+
+    def _regex(self, pattern):
+        '''
+        Returns the compiled regular expression for a pattern of the schema.
+        '''
+        regex = self._patterns.get(pattern)
+        if regex is None:
+            regex = _compile_pattern(pattern)
+        return regex
+
+    def _matcher(self, patternproperties):
+        '''
+        Returns the :class:`_PatternMatcher` for the patterns of a
+        ``patternProperties`` definition.
+        '''
+        matcher = self._matchers.get(id(patternproperties))
+        if (matcher is None or
+                matcher.patternproperties is not patternproperties):
+            matcher = _PatternMatcher(patternproperties, self._regex)
+        return matcher
+
+    def _enumeration(self, options):
+        '''
+        Returns the :class:`~validictory.enumeration.Enumeration` of the
+        options of an ``enum``.
+        '''
+        enumeration = self._enums.get(id(options))
+        if enumeration is None or enumeration.options is not options:
+            enumeration = Enumeration(options)
+        return enumeration
 
     def _validate(self, data, schema):
         return self.__validate("_data", {"_data": data}, schema).get('_data')
@@ -594,49 +867,814 @@ class SchemaValidator(object):
     def __validate(self, fieldname, data, schema):
 
         if schema is not None:
-            if not isinstance(schema, dict):
-                raise SchemaError("Schema structure is invalid.")
+            if self._checkpoint is not None:
+                self._checkpoint()
+            _node(self, schema).validate(self, fieldname, data)
 
-            newschema = copy.copy(schema)
+        return data
 
-            if isinstance(data, dict) and fieldname not in data and 'default' in schema:
-                data[fieldname] = schema['default']
 
-            if 'optional' in schema:
-                raise SchemaError('The "optional" attribute has been replaced'
-                                  ' by "required"')
-            if 'requires' in schema:
-                raise SchemaError('The "requires" attribute has been replaced'
-                                  ' by "dependencies"')
+def _method(cls, name):
+    '''
+    Returns the plain function behind ``cls.name``, or None.
+    '''
+    method = getattr(cls, name, None)
+    return getattr(method, '__func__', method)
+
 
-            if 'blank' not in schema:
-                newschema['blank'] = self.blank_by_default
+def _compile_pattern(pattern):
+    '''
+    Compiles a regular expression of the schema, raising a SchemaError if it
+    is not valid.
+    '''
+    try:
+        return re.compile(pattern)
+    except (re.error, TypeError) as e:
+        raise SchemaError("Invalid regular expression %r: %s" % (pattern, e))
 
-            self.validate_required(data, fieldname, newschema,
-                newschema.pop('required', self.required_by_default))
 
-            if 'type' in schema:
-                self.push_error_stack()
-                self.validate_type(data, fieldname, newschema, newschema.pop('type'))
-                errs = self.pop_error_stack()
+def _patterns(schema):
+    '''
+    Yields the regular expressions used by a schema.
+    '''
+    if 'pattern' in schema:
+        yield schema['pattern']
+    patternproperties = schema.get('patternProperties')
+    if isinstance(patternproperties, dict):
+        for pattern in patternproperties:
+            yield pattern
+
+
+class _PatternMatcher(object):
+    '''
+    Classifies property names against the patterns of a ``patternProperties``
+    definition, for ``patternProperties`` and ``additionalProperties`` alike.
+
+    Instead of trying every pattern on every property, the patterns are
+    joined in a single alternation with a named group for each of them: one
+    match tells the first pattern a name matches, and the alternation of the
+    patterns that follow it is then tried for the next one, and so on. The
+    results are kept, as the same names tend to come up again and again.
+    '''
+
+    # patterns that can't be put in an alternation: named groups, back
+    # references and global flags would clash with each other, and the
+    # groups conditionals refer to would be numbered differently
+    unsafe = re.compile(r'\\[1-9]|\(\?P|\(\?[iLmsux]|\(\?\(')
+    memo_size = 4096
+
+    def __init__(self, patternproperties, regex):
+        self.patternproperties = patternproperties
+        self.patterns = list(patternproperties)
+        self.regexes = [regex(pattern) for pattern in self.patterns]
+        self.memo = {}
+
+        # alternations of the patterns from each index on, built on demand
+        if any(self.unsafe.search(pattern) for pattern in self.patterns):
+            self.combined = None
+        else:
+            self.combined = [None] * len(self.patterns)
+
+    def _combined(self, start):
+        combined = self.combined[start]
+        if combined is None:
+            source = '|'.join('(?P<_%d>%s)' % (index, self.patterns[index])
+                              for index in range(start, len(self.patterns)))
+            try:
+                combined = re.compile(source)
+            except Exception:
+                # too many groups for the re module
+                combined = False
+            self.combined[start] = combined
+        return combined
+
+    def classify(self, key):
+        '''
+        Returns the indexes of the patterns matching a property name, an
+        empty tuple if there is none.
+        '''
+        indexes = self.memo.get(key)
+        if indexes is not None:
+            return indexes
+
+        indexes = []
+        start = 0
+        while start < len(self.regexes):
+            combined = self.combined and self._combined(start)
+            if not combined:
+                indexes.extend(
+                    index for index in range(start, len(self.regexes))
+                    if self.regexes[index].match(key))
+                break
+
+            match = combined.match(key)
+            if match is None:
+                break
+            index = int(match.lastgroup[1:])
+            indexes.append(index)
+            start = index + 1
+
+        indexes = tuple(indexes)
+        if len(self.memo) >= self.memo_size:
+            self.memo.clear()
+        self.memo[key] = indexes
+        return indexes
+
+    def buckets(self, items):
+        '''
+        Returns, for each pattern, the names of the ``(name, value)`` items
+        matching it.
+        '''
+        buckets = [[] for pattern in self.patterns]
+        for key, value in items:
+            for index in self.classify(key):
+                buckets[index].append(key)
+        return buckets
+
+
+def _node(validator, schema):
+    '''
+    Returns the compiled node of a schema.
+    '''
+    node = validator._nodes.get(id(schema))
+    if node is None or node.schema is not schema:
+        # not part of the compiled schema (built on the fly by a validate_*
+        # method), compile it for this visit only.
+        node = _SchemaNode(validator, schema)
+    return node
+
+
+# how SchemaValidator.validate_type_<name> tests its types, as the exact types
+# and the classes to check with isinstance
+_TYPE_CLASSES = {
+    'string': ((), (_str_type,)),
+    'integer': (_int_types, ()),
+    'number': (_int_types + (float,), ()),
+    'boolean': ((bool,), ()),
+    'object': ((), (Mapping,)),
+    'array': ((), (list, tuple)),
+    'null': ((type(None),), ()),
+}
+
+
+class _TypeTest(object):
+    '''
+    Tells whether a value is of one of a set of types, once the
+    ``validate_type_<name>`` of the types have been looked up.
+
+    The types :class:`SchemaValidator` knows about are tested all at once,
+    with a set of exact types and a tuple for isinstance, the ones added or
+    redefined by a subclass are called.
+    '''
+
+    __slots__ = ('exact', 'classes', 'checkers', 'strings')
+
+    def __init__(self):
+        self.exact = set()
+        self.classes = ()
+        self.checkers = []
+        # whether strings can be of the types
+        self.strings = False
+
+    def add(self, cls, fieldtype):
+        if not fieldtype:
+            # no type to check
+            self.add(cls, 'any')
+            return
+
+        try:
+            type_checker = _method(cls, 'validate_type_%s' % fieldtype)
+        except UnicodeEncodeError:
+            type_checker = None
+        if type_checker is None:
+            raise SchemaError("Field type '%s' is not supported." % fieldtype)
+
+        if type_checker is _method(SchemaValidator, 'validate_type_any'):
+            self.exact = None
+            self.strings = True
+        elif (fieldtype in _TYPE_CLASSES and type_checker is
+                _method(SchemaValidator, 'validate_type_%s' % fieldtype)):
+            exact, classes = _TYPE_CLASSES[fieldtype]
+            if self.exact is not None:
+                self.exact.update(exact)
+            self.classes += classes
+            self.strings = self.strings or fieldtype == 'string'
+        else:
+            self.checkers.append(type_checker)
+            self.strings = True
+
+    def __call__(self, validator, value):
+        if (self.exact is None or type(value) in self.exact or
+                (self.classes and isinstance(value, self.classes))):
+            return True
+        for type_checker in self.checkers:
+            if type_checker(validator, value):
+                return True
+        return False
+
+
+class _TypeCheck(object):
+    '''
+    :meth:`SchemaValidator.validate_type` for the ``type`` of a schema,
+    with the type names resolved once.
+
+    Unions of types are tested at once by a :class:`_TypeTest` (schemas
+    made only of a type, such as the ones of :attr:`schema.String.nullable`,
+    count as types), only the other schemas of a union are validated the
+    usual way.
+    '''
+
+    __slots__ = ('fieldtype', 'alternatives')
+
+    def __init__(self, validator, fieldtype):
+        self.fieldtype = fieldtype
+
+        if not fieldtype:
+            self.alternatives = []
+        elif isinstance(fieldtype, (list, tuple)):
+            self.alternatives = []
+            for eachtype in _flatten(fieldtype):
+                alternative = eachtype
+                if not isinstance(eachtype, dict) or not eachtype:
+                    alternative = _TypeTest()
+                    alternative.add(type(validator), eachtype)
+                else:
+                    alternative = _type_test(validator, eachtype) or eachtype
+
+                last = self.alternatives and self.alternatives[-1]
+                if (isinstance(alternative, _TypeTest) and
+                        isinstance(last, _TypeTest)):
+                    self.alternatives[-1] = _merge(last, alternative)
+                else:
+                    self.alternatives.append(alternative)
+        elif isinstance(fieldtype, dict):
+            self.alternatives = [fieldtype]
+        else:
+            test = _TypeTest()
+            test.add(type(validator), fieldtype)
+            self.alternatives = [test]
+
+    def check(self, validator, x, fieldname):
+        '''
+        Returns whether the field is of the type, the errors being added to
+        those of the validator if it is not.
+        '''
+        alternatives = self.alternatives
+        if not alternatives:
+            return True
+
+        # We need to know if the field exists or if it's just Null
+        try:
+            value = x[fieldname]
+        except KeyError:
+            return True
+
+        fieldtype = self.fieldtype
+        if isinstance(fieldtype, dict):
+            validator.push_error_stack()
+            _node(validator, fieldtype).validate(validator, fieldname, x)
+            errs = validator.pop_error_stack()
+            if errs:
+                validator.error_list += errs
+                validator._check_errors()
+                return False
+            return True
+
+        for alternative in alternatives:
+            if isinstance(alternative, _TypeTest):
+                if alternative(validator, value):
+                    return True
+            else:
+                state = validator._begin_attempt()
+                try:
+                    _node(validator, alternative).validate(validator,
+                                                           fieldname, x)
+                except _Stop:
+                    pass
+                if not validator._end_attempt(state):
+                    return True
+
+        validator._error('incorrect-type', fieldtype,
+                         validator.get(x, fieldname))
+        return False
+
+
+def _flatten(fieldtype):
+    for eachtype in fieldtype:
+        if isinstance(eachtype, (list, tuple)) and eachtype:
+            for subtype in _flatten(eachtype):
+                yield subtype
+        else:
+            yield eachtype
+
+
+def _merge(first, second):
+    merged = _TypeTest()
+    if first.exact is None or second.exact is None:
+        merged.exact = None
+    else:
+        merged.exact = first.exact | second.exact
+    merged.classes = first.classes + second.classes
+    merged.checkers = first.checkers + second.checkers
+    merged.strings = first.strings or second.strings
+    return merged
+
+
+def _type_test(validator, schema):
+    '''
+    Returns a :class:`_TypeTest` doing the same as validating a value that
+    exists against a schema of a union of types, or None if there is more to
+    the schema than its type.
+    '''
+    node = _SchemaNode(validator, schema)
+
+    if node.required is not None or node.type_check is None:
+        return None
+
+    test = _TypeTest()
+    for alternative in node.type_check.alternatives:
+        if not isinstance(alternative, _TypeTest):
+            return None
+        test = _merge(test, alternative)
+    if not node.type_check.alternatives:
+        test.exact = None
+        test.strings = True
+
+    for method, value in node.checks:
+        # blank=False only matters for strings
+        if (method is not _method(SchemaValidator, 'validate_blank') or
+                test.strings):
+            return None
+    return test
+
+
+_NUMERIC_TYPES = frozenset(_int_types + (float,))
+
+# the keywords arrays can be checked for all at once, with the keywords
+# making them exclusive
+_NUMERIC_CHECKS = {
+    'minimum': 'exclusiveMinimum',
+    'maximum': 'exclusiveMaximum',
+    'divisibleBy': None,
+    'blank': None,
+}
+_COLUMN_CHECKS = dict(_NUMERIC_CHECKS, enum=None, minLength=None,
+                      maxLength=None)
+
+# the number of items checked at once between the steps of a validation
+# going a step at a time, see validate_async
+_CHECKPOINT_SLICE = 256
+
+# what checking a whole array at once stands in for
+_BATCH_METHODS = ('validate_items', 'validate_properties',
+                  'validate_required', 'validate_type_number', '_error',
+                  'current_field_name', 'get')
+
+
+def _items_batch(validator, node):
+    '''
+    Returns an object checking a whole array against the schema of a node
+    as its ``items``, a :class:`~validictory.numeric.NumericItems` or a
+    :class:`~validictory.columns.RecordColumns`, or None if the items must
+    be validated one by one.
+    '''
+    cls = type(validator)
+    if node.required is not None or any(
+            _method(cls, name) is not _method(SchemaValidator, name)
+            for name in _BATCH_METHODS):
+        return None
+    return _numeric_items(node) or _record_columns(validator, node)
+
+
+def _simple_type(node):
+    '''
+    Returns the :class:`_TypeTest` of a node checking only for types
+    SchemaValidator knows about, or None.
+    '''
+    if node.type_check is None:
+        return None
+    alternatives = node.type_check.alternatives
+    if (len(alternatives) != 1 or not isinstance(alternatives[0], _TypeTest)
+            or alternatives[0].exact is None or alternatives[0].checkers):
+        return None
+    return alternatives[0]
+
+
+def _batch_checks(node, keywords):
+    '''
+    Returns the ``(keyword, value, exclusive)`` of the checks of a node, or
+    None if some aren't among ``keywords``.
+    '''
+    checks = []
+    for method, value in node.checks:
+        keyword = method.__name__[len('validate_'):]
+        if (keyword not in keywords or
+                method is not _method(SchemaValidator, method.__name__)):
+            return None
+        if keyword == 'divisibleBy' and (
+                type(value) not in _NUMERIC_TYPES or value == 0):
+            return None
+        if keyword == 'enum' and not isinstance(value, Container):
+            return None
+        exclusive = keywords[keyword]
+        checks.append((keyword, value,
+                       bool(exclusive and node.params.get(exclusive, False))))
+    return checks
+
+
+def _numeric_items(node):
+    test = _simple_type(node)
+    if test is None or test.classes or not test.exact <= _NUMERIC_TYPES:
+        return None
+
+    checks = _batch_checks(node, _NUMERIC_CHECKS)
+    if checks is None:
+        return None
+    # numbers are never blank
+    checks = [check for check in checks if check[0] != 'blank']
+    if any(type(value) not in _NUMERIC_TYPES for _, value, _ in checks):
+        return None
+    return NumericItems(node.type[1], test.exact, checks)
+
+
+def _record_columns(validator, node):
+    test = _simple_type(node)
+    if (test is None or test.strings or
+            not (dict in test.exact or issubclass(dict, test.classes))):
+        return None
+
+    properties = None
+    for method, value in node.checks:
+        name = method.__name__
+        if (name not in ('validate_properties', 'validate_blank') or
+                method is not _method(SchemaValidator, name)):
+            return None
+        if name == 'validate_properties':
+            properties = value
+    if not isinstance(properties, dict):
+        return None
+
+    columns = []
+    for name, schema in properties.items():
+        if schema is None:
+            continue
+        if not isinstance(name, _str_type) or not isinstance(schema, dict):
+            return None
+        column = _column(validator, name, schema)
+        if column is None:
+            return None
+        columns.append(column)
+    return RecordColumns(node.type[1], (test.exact, test.classes), columns)
+
+
+def _column(validator, name, schema):
+    try:
+        node = _SchemaNode(validator, schema)
+    except SchemaError:
+        # reported when validating the records one by one
+        return None
+    if node.has_default:
+        return None
+
+    types = None
+    if node.type_check is not None and node.type_check.alternatives:
+        test = _simple_type(node)
+        if test is None:
+            return None
+        types = (test.exact, test.classes)
+    elif node.type is not None and node.type_check is None:
+        return None
+
+    checks = _batch_checks(node, _COLUMN_CHECKS)
+    if checks is None:
+        return None
+    checks = [(keyword, Enumeration(value) if keyword == 'enum' else value,
+               exclusive) for keyword, value, exclusive in checks]
+    return Column(name, node.required is not None,
+                  node.type and node.type[1], types, checks,
+                  _numeric_items(node))
+
+
+def _report_items(validator, failures, start=0):
+    '''
+    Adds the errors of the failing items of an array to those of the
+    validator, as validating the items one by one would. The indexes of the
+    failures are counted from ``start``.
+    '''
+    if not failures:
+        return
+    fields = validator.current_field[1:]
+    for index, errors in failures:
+        item = fields + ['[%d]' % (start + index)]
+        for error in errors:
+            if validator._quiet:
+                validator.error_list.append(_INVALID)
+                continue
+            # the errors of records tell the property they are about
+            path = item if len(error) == 3 or error[3] is None else (
+                item + [error[3]])
+            validator.error_list.append((error[0], u'.'.join(path),
+                                         error[1], error[2]))
+        validator._check_errors()
+
+
+def _subschemas(schema):
+    '''
+    Yields the sub-schemas directly referenced by a schema.
+    '''
+    for key in ('properties', 'patternProperties'):
+        value = schema.get(key)
+        if isinstance(value, dict):
+            for subschema in value.values():
+                yield subschema
+
+    for key in ('type', 'items', 'extends', 'disallow',
+                'additionalProperties', 'additionalItems'):
+        value = schema.get(key)
+        if isinstance(value, dict):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            for subschema in value:
+                yield subschema
+
+
+class _SchemaNode(object):
+    '''
+    A single schema dict compiled for a validator.
+
+    All the work :meth:`SchemaValidator.validate` used to do on every visit of
+    the schema (copying it, filling in ``blank`` and ``required``, looking up
+    the ``validate_<property>`` methods) is done once here, leaving a list of
+    ``(method, argument)`` checks to run against the data.
+    '''
+
+    __slots__ = ('schema', 'params', 'has_default', 'default', 'required',
+                 'type', 'type_check', 'checks', '_batch')
+
+    def __init__(self, validator, schema):
+        if not isinstance(schema, dict):
+            raise SchemaError("Schema structure is invalid.")
+
+        if 'optional' in schema:
+            raise SchemaError('The "optional" attribute has been replaced'
+                              ' by "required"')
+        if 'requires' in schema:
+            raise SchemaError('The "requires" attribute has been replaced'
+                              ' by "dependencies"')
+
+        cls = type(validator)
+
+        self.schema = schema
+        self.has_default = 'default' in schema
+        self.default = schema.get('default')
+
+        # a copy of the same class keeps the order of the keys, immutable
+        # (hashable) schemas are copied to a dict instead
+        params = self.params = (dict(schema) if isinstance(schema, Hashable)
+                                else copy.copy(schema))
+        if 'blank' not in schema:
+            params['blank'] = validator.blank_by_default
+
+        required = params.pop('required', validator.required_by_default)
+        validate_required = _method(cls, 'validate_required')
+        if (validate_required is _method(SchemaValidator, 'validate_required')
+                and (validator.ignore_required or not required)):
+            self.required = None
+        else:
+            self.required = (validate_required, required)
+
+        self.type = self.type_check = None
+        if 'type' in params:
+            validate_type = _method(cls, 'validate_type')
+            self.type = (validate_type, params.pop('type'))
+            if validate_type is _method(SchemaValidator, 'validate_type'):
+                self.type_check = _TypeCheck(validator, self.type[1])
+
+        self.checks = []
+        for schemaprop, value in params.items():
+            method = _method(cls, 'validate_' + schemaprop)
+            if not method:
+                continue
+
+            if method is _method(SchemaValidator, 'validate_' + schemaprop):
+                if schemaprop == 'blank' and value:
+                    # blank values are allowed, nothing to check
+                    continue
+                if schemaprop in ('title', 'description'):
+                    # these only describe the schema, check them right away
+                    method(validator, {}, None, params, value)
+                    continue
+
+            self.checks.append((method, value))
+
+        self._batch = _UNSET
+
+    def validate(self, validator, fieldname, data):
+        # the link to this visit tells the path of the field for the errors
+        parent = validator._path
+        validator._path = (parent, data, fieldname)
+        try:
+            if (self.has_default and isinstance(data, dict) and
+                    fieldname not in data):
+                data[fieldname] = self.default
+
+            params = self.params
+
+            if self.required is not None:
+                method, required = self.required
+                method(validator, data, fieldname, params, required)
+
+            if self.type_check is not None:
+                if not self.type_check.check(validator, data, fieldname):
+                    # do not keep validating an object if its type was not correct !
+                    return
+            elif self.type is not None:
+                method, fieldtype = self.type
+                validator.push_error_stack()
+                method(validator, data, fieldname, params, fieldtype)
+                errs = validator.pop_error_stack()
                 if errs:
                     # do not keep validating an object if its type was not correct !
-                    self.error_list += errs
-                    return data
+                    validator.error_list += errs
+                    validator._check_errors()
+                    return
 
-            for schemaprop in newschema:
-                validatorname = "validate_" + schemaprop
+            for method, value in self.checks:
+                method(validator, data, fieldname, params, value)
+        finally:
+            validator._path = parent
 
-                validator = getattr(self, validatorname, None)
-                if validator:
-                    validator(data, fieldname, newschema, newschema.get(schemaprop))
+    def batch(self, validator):
+        '''
+        Returns what checks a whole array against the schema as its
+        ``items`` at once, or None, see :func:`_items_batch`.
+        '''
+        if self._batch is _UNSET:
+            self._batch = _items_batch(validator, self)
+        return self._batch
 
-        return data
+
+class CompiledSchema(object):
+    '''
+    A schema compiled once against the configuration of a validator
+    (``required_by_default``, ``blank_by_default``, ``ignore_required`` and
+    the ``validate_<property>`` methods of its class), that can then validate
+    any number of documents without walking the schema dict again.
+
+    Use :meth:`SchemaValidator.compile` or :func:`compile` to create one.
+    The schema should not be modified once compiled.
+    '''
+
+    def __init__(self, validator, schema):
+        self.validator = validator
+        self.schema = schema
+        self.nodes = {}
+        self.patterns = {}
+        self.matchers = {}
+        self.enums = {}
+        self._contents = None
+
+        pending = [schema] if schema is not None else []
+        while pending:
+            subschema = pending.pop()
+            if not isinstance(subschema, dict) or id(subschema) in self.nodes:
+                continue
+            self.nodes[id(subschema)] = _SchemaNode(validator, subschema)
+            for pattern in _patterns(subschema):
+                self.patterns[pattern] = _compile_pattern(pattern)
+            patternproperties = subschema.get('patternProperties')
+            if isinstance(patternproperties, dict):
+                self.matchers[id(patternproperties)] = _PatternMatcher(
+                    patternproperties, self.patterns.get)
+            options = subschema.get('enum')
+            if isinstance(options, (list, tuple)):
+                self.enums[id(options)] = Enumeration(options)
+            pending.extend(_subschemas(subschema))
+
+    @property
+    def size(self):
+        '''
+        Estimated memory used by the compiled schema, in bytes.
+        '''
+        size = sys.getsizeof(self.nodes) + sys.getsizeof(self.patterns)
+        for node in self.nodes.values():
+            size += (sys.getsizeof(node) + sys.getsizeof(node.params) +
+                     sys.getsizeof(node.checks))
+        return size
+
+    def validate(self, data):
+        '''
+        Validates a piece of json data against the compiled schema.
+        Returns the validated data.
+        '''
+        # the state of the validation is kept on a copy of the validator, so
+        # that a compiled schema can be shared.
+        return self._apply(copy.copy(self.validator), data)
+
+    def is_valid(self, data):
+        '''
+        Tells whether a piece of json data is valid against the compiled
+        schema. The validation stops at the first error, no error is built
+        and no :class:`ValidationError` is raised.
+
+        Like :meth:`validate`, this fills in the defaults of the schema.
+        '''
+        return self._check(copy.copy(self.validator), data)
+
+    def validate_many(self, iterable):
+        '''
+        Validates each piece of json data of an iterable against the compiled
+        schema, yielding a :class:`ValidationResult` for each as it goes:
+        whether it is ``valid``, the list of ``errors`` and the validated
+        (or coerced) ``data``.
+
+        The documents are validated one at a time with the same validator,
+        and invalid ones don't raise.
+        '''
+        validator = copy.copy(self.validator)
+        for data in iterable:
+            result, errors = self._collect(validator, data)
+            yield ValidationResult(not errors, errors, result)
+
+    def _keep_contents(self):
+        '''
+        Keeps a copy of the schema, for :meth:`_current` to tell whether it
+        has been modified since.
+        '''
+        try:
+            self._contents = copy.deepcopy(self.schema)
+        except (TypeError, copy.Error):
+            # something in the schema can't be copied
+            self._contents = None
+
+    def _current(self, schema):
+        '''
+        Tells whether the compiled schema is that of ``schema``, as it is now:
+        ``schema`` and the schema compiled must both still be equal to the
+        copy kept by :meth:`_keep_contents`, or without a copy, be the same
+        object.
+        '''
+        contents = self._contents
+        if contents is None:
+            return schema is self.schema
+        return contents == schema and (schema is self.schema or
+                                       contents == self.schema)
+
+    def _reset(self, validator):
+        validator.error_list = []
+        validator.error_stack = []
+        validator._path = None
+        validator._path_prefix = None
+        validator._quiet = False
+        validator._nodes = self.nodes
+        validator._patterns = self.patterns
+        validator._matchers = self.matchers
+        validator._enums = self.enums
+
+    def _check(self, validator, data):
+        self._reset(validator)
+        validator._limit, validator._limit_depth = 1, 0
+        validator._quiet = True
+
+        try:
+            self._run(validator, data)
+        except _Stop:
+            return False
+        return not validator.error_list
+
+    def _apply(self, validator, data):
+        result, errors = self._collect(validator, data)
+        if errors:
+            raise ValidationError(errors)
+        return result
+
+    def _collect(self, validator, data):
+        # returns the validated data and the errors
+        self._reset(validator)
+
+        limit = 1 if validator.fail_fast else validator.max_errors or None
+        validator._limit, validator._limit_depth = limit, 0
+
+        try:
+            result = self._run(validator, data)
+        except _Stop:
+            del validator.error_list[limit:]
+            return data, validator.error_list
+        return result, validator.error_list
+
+    def _run(self, validator, data):
+        return validator._validate(data, self.schema)
+
+
+#: The compiled schemas used by :func:`validate`, see
+#: :class:`~validictory.cache.SchemaCache`.
+schema_cache = SchemaCache()
 
 
 def validate(data, schema, validator_cls=SchemaValidator,
              format_validators=None, required_by_default=False,
-             blank_by_default=False, ignore_required=False):
+             blank_by_default=False, ignore_required=False,
+             fail_fast=False, max_errors=None):
     '''
     Validates a parsed json document against the provided schema. If errors
     are found, a :class:`ValidationError` is raised, the list of errors in its
@@ -650,8 +1688,124 @@ def validate(data, schema, validator_cls=SchemaValidator,
     :param validator_cls: optional validator class (default is
         :class:`SchemaValidator`)
     :param format_validators: optional dictionary of custom format validators
+    :param fail_fast: stop validating at the first error
+    :param max_errors: optional number of errors after which to stop
+        validating
+
+    Compiled schemas are kept in :data:`schema_cache`, keyed by the contents
+    of the schema (see :func:`~validictory.cache.fingerprint`) and the
+    options, and shared by equal schemas. A schema modified after it has
+    been used is compiled again, unless it is still equal to what it was
+    (such as ``1`` becoming ``1.0``) or holds values that can't be copied.
+    '''
+    return _cached(schema, validator_cls, format_validators,
+                   required_by_default, blank_by_default, ignore_required,
+                   fail_fast, max_errors).validate(data)
+
+
+def is_valid(data, schema, validator_cls=SchemaValidator,
+             format_validators=None, required_by_default=False,
+             blank_by_default=False, ignore_required=False):
+    '''
+    Tells whether a parsed json document is valid against the provided
+    schema, without building any error: meant for filtering documents, see
+    :meth:`CompiledSchema.is_valid`. Takes the same options as
+    :func:`validate`.
+
+    If there is an issue in the schema a :class:`SchemaError` will be raised.
+    '''
+    return _cached(schema, validator_cls, format_validators,
+                   required_by_default, blank_by_default, ignore_required,
+                   False, None).is_valid(data)
+
+
+def validate_many(iterable, schema, validator_cls=SchemaValidator,
+                  format_validators=None, required_by_default=False,
+                  blank_by_default=False, ignore_required=False,
+                  fail_fast=False, max_errors=None):
+    '''
+    Validates each parsed json document of an iterable against the provided
+    schema, compiled once, and returns an iterator of the
+    :class:`ValidationResult` of each, see
+    :meth:`CompiledSchema.validate_many`. Takes the same options as
+    :func:`validate`.
+
+    If there is an issue in the schema a :class:`SchemaError` will be raised.
+    '''
+    return _cached(schema, validator_cls, format_validators,
+                   required_by_default, blank_by_default, ignore_required,
+                   fail_fast, max_errors).validate_many(iterable)
+
+
+def _cached(schema, validator_cls, format_validators, required_by_default,
+            blank_by_default, ignore_required, fail_fast, max_errors):
+    '''
+    Returns the compiled schema from :data:`schema_cache`, compiling it if
+    needed.
+    '''
+    options = (validator_cls, id(format_validators), required_by_default,
+               blank_by_default, ignore_required, fail_fast, max_errors)
+
+    def compile(schema):
+        v = _validator(validator_cls, format_validators, required_by_default,
+                       blank_by_default, ignore_required, fail_fast, max_errors)
+        return v.compile(schema)
+
+    return _lookup(schema_cache, schema, options, compile)
+
+
+def _lookup(cache, schema, options, compile):
+    '''
+    Returns the compiled schema kept in ``cache`` for ``schema`` and
+    ``options``, compiling it with ``compile`` if needed.
+    '''
+    key = (fingerprint(schema),) + options
+
+    compiled = cache.get(key)
+    if compiled is not None and not compiled._current(schema):
+        # the schema was modified since it was fingerprinted, or the schema
+        # the entry was compiled from since it was compiled
+        _forget(schema)
+        key = (fingerprint(schema),) + options
+        compiled = cache.get(key)
+    if compiled is None or not compiled._current(schema):
+        compiled = compile(schema)
+        compiled._keep_contents()
+        cache.put(key, compiled, compiled.size)
+    return compiled
+
+
+def compile(schema, validator_cls=SchemaValidator, format_validators=None,
+            required_by_default=False, blank_by_default=False,
+            ignore_required=False, fail_fast=False, max_errors=None,
+            codegen=False):
+    '''
+    Compiles the provided schema once, so that many documents can be
+    validated against it. Takes the same options as :func:`validate` and
+    returns a :class:`CompiledSchema`.
+
+    If there is an issue in the schema a :class:`SchemaError` will be raised.
+
+    :param codegen: generate python source specialized for the schema
+        instead of walking compiled nodes (see
+        :class:`~validictory.codegen.GeneratedSchema`)
+    '''
+    v = _validator(validator_cls, format_validators, required_by_default,
+                   blank_by_default, ignore_required, fail_fast, max_errors)
+    return v.compile(schema, codegen)
+
+
+def _validator(validator_cls, format_validators, required_by_default,
+               blank_by_default, ignore_required, fail_fast, max_errors):
+    '''
+    Builds a validator, passing its class the arguments it has always
+    taken, so that subclasses written before ``fail_fast`` and
+    ``max_errors`` keep working.
     '''
     v = validator_cls(format_validators, required_by_default, blank_by_default, ignore_required)
-    return v.validate(data, schema)
+    v.fail_fast = fail_fast
+    v.max_errors = max_errors
+    return v
 
-__all__ = ['SchemaValidator', 'validate']
+__all__ = ['SchemaValidator', 'CompiledSchema', 'ValidationResult',
+           'validate', 'is_valid', 'validate_many', 'compile', 'schema_cache']